@@ -49,7 +49,7 @@ REM Запуск основной программы
 echo.
 echo [INFO] Запуск JIRA Analytics Tool...
 echo ========================================
-python src/main.py
+python -m src.main
 
 REM Пауза для просмотра результатов
 echo.
@@ -1,5 +1,38 @@
 import os  # Файловая система и проверка существования файлов
-import yaml  # YAML файлы (формат конфигурации)
+import copy  # Копия конфигурации по умолчанию
+import functools  # Кэширование результатов функций
+
+# Функция разбора YAML (определяется при первом чтении файла, см. _get_yaml_load)
+_YAML_LOAD = None
+
+
+# Конфигурация по умолчанию (используется, если файл настроек не найден)
+_DEFAULT_CONFIG = {
+    "jira": {  # Раздел настроек JIRA
+        "server": "https://issues.apache.org/jira",  # Адрес сервера JIRA
+        "project_key": "KAFKA",  # Ключ проекта JIRA
+        "max_issues": 1000,  # Максимальное количество задач для загрузки
+        "use_cache": True  # Кеширование
+    },
+    "visualization": {  # Раздел настроек визуализации
+        "output_dir": "reports"  # Папка для сохранения отчётов и графиков
+    }
+}
+
+
+def _get_yaml_load():
+    """
+    Возвращает функцию безопасного разбора YAML.
+    
+    yaml импортируется только здесь, при первом реальном чтении конфигурации.
+    Загрузчик - C-реализация (libyaml), если доступна, иначе чистый Python.
+    """
+    global _YAML_LOAD
+    if _YAML_LOAD is None:
+        import yaml  # YAML файлы
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _YAML_LOAD = functools.partial(yaml.load, Loader=loader)
+    return _YAML_LOAD
 
 
 def load_config(config_path="configs/settings.yaml"):
@@ -12,45 +45,63 @@ def load_config(config_path="configs/settings.yaml"):
     Returns:
         dict: Конфигурация в виде словаря
     """
-    if not os.path.exists(config_path):
+    try:
+        # Открываем файл сразу, без отдельной проверки существования
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return _get_yaml_load()(f)  # Безопасная загрузка YAML (без исполнения кода)
+    except FileNotFoundError:
         # Возвращаем конфигурацию по умолчанию, если файл не найден
-        return {
-            "jira": {  # Раздел настроек JIRA
-                "server": "https://issues.apache.org/jira",  # Адрес сервера JIRA
-                "project_key": "KAFKA",  # Ключ проекта JIRA
-                "max_issues": 1000,  # Максимальное количество задач для загрузки
-                "use_cache": True  # Кеширование
-            },
-            "visualization": {  # Раздел настроек визуализации
-                "output_dir": "reports"  # Папка для сохранения отчётов и графиков
-            }
-        }
-    
-    # Если файл существует, открываем его для чтения
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)  # Безопасная загрузка YAML (без исполнения кода)
+        # (копию: вызывающий код может её изменить, образец остаётся нетронутым)
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
 
-def get_config():
+@functools.lru_cache(maxsize=4)
+def _build_config(config_path, mtime):
     """
-    Получение конфигурации приложения.
+    Загрузка и подготовка конфигурации (результат кэшируется).
     
+    Args:
+        config_path: Путь к файлу конфигурации
+        mtime: Время изменения файла (ключ кэша, 0 если файла нет)
+        
     Returns:
         dict: Конфигурация
     """
-    config = load_config()  # Конфигурация из файла
+    config = load_config(config_path)  # Конфигурация из файла
     
     # Форматирование JQL фильтров
     if "jql_filters" in config.get("jira", {}):
         project_key = config["jira"]["project_key"]  # Ключ проекта
         jql_filters = config["jira"]["jql_filters"]  # Фильтры JQL
-        for key, value in jql_filters.items():
-            # Подставляем project_key в JQL запросы
-            jql_filters[key] = value.format(project_key=project_key)
+        # Подставляем project_key в JQL запросы один раз; результат общий
+        # для всех вызовов get_config (обычный dict - конфигурация передаётся в процессы)
+        config["jira"]["jql_filters"] = {
+            key: value.format(project_key=project_key) for key, value in jql_filters.items()
+        }
     
     return config  # Готовая конфигурацию
 
 
+def get_config(config_path="configs/settings.yaml"):
+    """
+    Получение конфигурации приложения.
+    
+    Файл читается один раз для каждой версии (по времени изменения),
+    повторные вызовы возвращают тот же словарь.
+    
+    Args:
+        config_path: Путь к файлу конфигурации
+        
+    Returns:
+        dict: Конфигурация
+    """
+    try:
+        mtime = os.path.getmtime(config_path)  # Время изменения файла
+    except OSError:
+        mtime = 0  # Файла нет - будет конфигурация по умолчанию
+    return _build_config(config_path, mtime)
+
+
 # Тестирование
 if __name__ == "__main__":
     # Этот код выполняется только при прямом запуске файла
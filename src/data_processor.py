@@ -2,11 +2,15 @@
 Модуль для обработки данных из JIRA.
 Преобразует сырые данные в формат, удобный для построения графиков.
 """
-import pandas as pd           # Библиотека для работы с табличными данными
-import numpy as np           # Для математических операций (нужна для статистики)
+from __future__ import annotations  # Аннотации не вычисляются при импорте модуля
+
 import logging               # Для записи логов работы программы
-from datetime import datetime, timedelta  # Для работы с датами
-from typing import Dict, List, Any  # Аннотации типов для документации
+from typing import TYPE_CHECKING, Dict, List, Any, Union  # Аннотации типов для документации
+
+# pandas импортируется внутри методов, которые работают с DataFrame,
+# чтобы импорт модуля не тянул за собой тяжёлую библиотеку
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataProcessor:
@@ -29,86 +33,82 @@ class DataProcessor:
         # Порог для долгих задач (7 дней в часах)
         self.long_task_threshold = data_config.get("long_task_threshold_hours", 168)
     
-    def create_dataframe(self, issues: List[Dict]) -> pd.DataFrame:
+    def create_dataframe(self, issues: Union[Dict[str, List], List[Dict]]) -> pd.DataFrame:
         """
-        Преобразует список задач в DataFrame Pandas.
+        Преобразует задачи в DataFrame Pandas.
         
         Args:
-            issues: Список задач из JIRA
+            issues: Задачи из JIRA по колонкам (имя поля -> список значений)
+                или список словарей
             
         Returns:
             pd.DataFrame: Таблица с обработанными данными
         """
+        import pandas as pd  # Библиотека для работы с табличными данными
+        
         if not issues:  # Проверка, есть ли данные
             self.logger.warning("Нет данных для обработки")
             return pd.DataFrame()  # Возврат пустой таблицы
-        self.logger.info(f"Обработка {len(issues)} задач")
         
-        # Создание DataFrame из списка словарей
+        # Создание DataFrame (колонки копируются в таблицу целиком)
         df = pd.DataFrame(issues)
+        original_count = len(df)  # Запоминает исходное количество строк
+        self.logger.info(f"Обработка {original_count} задач")
         
-        # Преобразование строки с датами в объекты datetime
-        df = self._convert_dates(df)
-        
-        # Добавление вычисляемых колонок
-        df = self._add_calculated_fields(df)
-        
-        # Очищита данных от ошибок
-        df = self._clean_data(df)
-        
-        return df  # Возврат готовой таблицы
-    
-    def _convert_dates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Преобразует текстовые даты в формат datetime."""
-        # Колонки, которые содержат даты
+        # 1. Преобразование строк с датами в объекты datetime (все колонки за один assign)
+        # Все даты JIRA в ISO 8601, поэтому разбор идёт по быстрому пути без угадывания формата
         date_columns = ['created', 'resolved', 'updated']
+        df = df.assign(**{
+            col: pd.to_datetime(df[col], errors='coerce', utc=True, format='ISO8601', cache=True)
+            for col in date_columns if col in df.columns
+        })
         
-        for col in date_columns:  # Для каждой колонки с датой
-            if col in df.columns:  # Если колонка существует в таблице
-                try:
-                    # Преобразование строки в datetime (с обработкой ошибок)
-                    df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
-                except Exception:
-                    pass  # Если ошибка - оставляет как есть
-        
-        return df
-    
-    def _add_calculated_fields(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Добавляет новые вычисляемые колонки."""
-        # Если есть дата создания, добавляет производные
+        # 2. Вычисляемые колонки (тоже одним assign)
+        calculated = {}
         if 'created' in df.columns:
-            df['created_date'] = df['created'].dt.date  # Только дата (без времени)
-            df['created_year'] = df['created'].dt.year  # Год создания
-            df['created_month'] = df['created'].dt.month  # Месяц создания
+            calculated['created_date'] = df['created'].dt.date  # Только дата (без времени)
+            calculated['created_year'] = df['created'].dt.year  # Год создания
+            calculated['created_month'] = df['created'].dt.month  # Месяц создания
         
-        # Если есть дата закрытия
         if 'resolved' in df.columns:
-            df['resolved_date'] = df['resolved'].dt.date
-        
-        # Если есть время выполнения в часах, вычисляет дни
-        if 'open_time_hours' in df.columns:
-            df['open_time_days'] = df['open_time_hours'] / 24  # Переводит часы в дни
-        
-        return df
-    
-    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Удаляет некорректные данные."""
-        original_count = len(df)  # Запоминает исходное количество строк
-        
-        # Удаляет задачи без даты создания
+            calculated['resolved_date'] = df['resolved'].dt.date
+        
+        # Время выполнения в часах: разница дат закрытия и создания для всей колонки сразу
+        if 'created' in df.columns and 'resolved' in df.columns:
+            open_time_hours = (df['resolved'] - df['created']).dt.total_seconds() / 3600.0
+            calculated['open_time_hours'] = open_time_hours
+            calculated['open_time_days'] = open_time_hours / 24  # Переводит часы в дни
+        elif 'open_time_hours' in df.columns:
+            calculated['open_time_days'] = df['open_time_hours'] / 24
+        
+        df = df.assign(**calculated)
+        
+        # 3. Очистка данных от ошибок одной маской:
+        # без даты создания или с отрицательным временем выполнения
+        # (задачи без даты закрытия остаются)
+        valid = None
         if 'created' in df.columns:
-            df = df.dropna(subset=['created'])
-        
-        # Удаляет задачи с отрицательным временем выполнения
+            valid = df['created'].notna()
         if 'open_time_hours' in df.columns:
-            df = df[df['open_time_hours'] >= 0]
+            non_negative = df['open_time_hours'].fillna(0) >= 0
+            valid = non_negative if valid is None else valid & non_negative
+        # Таблица копируется, только если есть что удалять
+        if valid is not None and not valid.all():
+            df = df.loc[valid]
         
         # Логируем количество удалённых строк
         cleaned_count = len(df)
         if cleaned_count < original_count:
             self.logger.info(f"Удалено {original_count - cleaned_count} некорректных записей")
         
-        return df
+        # 4. Статус и приоритет - категории: несколько различных значений хранятся
+        # целочисленными кодами, сравнения, группировки и подсчёты идут по кодам, а не по строкам
+        # (набор категорий берётся из данных: статусы зависят от workflow проекта)
+        categorical = {col: 'category' for col in ('status', 'priority') if col in df.columns}
+        if categorical:
+            df = df.astype(categorical, copy=False)
+        
+        return df  # Возврат готовой таблицы
     
     def prepare_for_plotting(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -124,6 +124,7 @@ class DataProcessor:
             return {}  # Возвращает пустой словарь
         
         plotting_data = {}  # Словарь для хранения данных графиков
+        # Значения остаются массивами NumPy: matplotlib принимает их без преобразования в списки
         
         # 1. Данные для гистограммы времени выполнения
         if 'open_time_hours' in df.columns:
@@ -133,9 +134,11 @@ class DataProcessor:
         if 'priority' in df.columns:
             # Сколько задач каждого приоритета
             priority_counts = df['priority'].value_counts()
+            # У категорий value_counts включает и отсутствующие в таблице значения
+            priority_counts = priority_counts[priority_counts > 0]
             plotting_data['priority_data'] = {
-                'labels': priority_counts.index.tolist(),  # Названия приоритетов
-                'values': priority_counts.values.tolist()  # Количество задач
+                'labels': priority_counts.index.to_numpy(),  # Названия приоритетов
+                'values': priority_counts.to_numpy()  # Количество задач
             }
         
         # 3. Данные для графика по дням
@@ -143,8 +146,8 @@ class DataProcessor:
             # Сколько задач создано в каждый день
             created_by_day = df['created_date'].value_counts().sort_index()
             plotting_data['daily_tasks_data'] = {
-                'dates': created_by_day.index.tolist(),    # Даты
-                'created': created_by_day.values.tolist()  # Количество
+                'dates': created_by_day.index.to_numpy(),    # Даты
+                'created': created_by_day.to_numpy()  # Количество
             }
         
         return plotting_data
@@ -168,13 +171,17 @@ class DataProcessor:
         
         # Статистика по времени выполнения
         if 'open_time_hours' in df.columns:
-            time_data = df['open_time_hours'].dropna()  # Убирает пустые значения
+            import numpy as np  # Для математических операций
+            
+            # Один непрерывный массив float64 для всех показателей
+            time_data = df['open_time_hours'].to_numpy(dtype=np.float64)
+            time_data = time_data[~np.isnan(time_data)]  # Убирает пустые значения
             if len(time_data) > 0:  # Если есть данные
                 stats['time_stats'] = {
-                    'mean': time_data.mean(),    # Среднее значение
-                    'median': time_data.median(),  # Медиана
-                    'min': time_data.min(),      # Минимальное значение
-                    'max': time_data.max()       # Максимальное значение
+                    'mean': float(time_data.mean()),      # Среднее значение
+                    'median': float(np.median(time_data)),  # Медиана
+                    'min': float(time_data.min()),        # Минимальное значение
+                    'max': float(time_data.max())         # Максимальное значение
                 }
         
         return stats
\ No newline at end of file
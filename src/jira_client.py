@@ -3,20 +3,46 @@
 Загружает задачи из JIRA для анализа.
 """
 import os        # Фйловая система
+import functools # Кэширование результатов функций
+import hashlib   # Хэш запроса для имени файла кэша
 import json      # Сохранение и загрузка данных в формате JSON
 import logging   # Ведение логов работы программы
-from datetime import datetime, timedelta  # Работа с датами и временем
-from typing import List, Dict, Any  # Типизация для лучшей читаемости кода
+import time      # Монотонные часы для запоминания актуальности кэша
+import threading # Блокировка при создании подключения из нескольких потоков
+import importlib.util  # Проверка установки библиотек без их импорта
+from concurrent.futures import ThreadPoolExecutor  # Параллельная загрузка страниц
+from datetime import timedelta  # Работа с интервалами времени
+from typing import List, Dict, Any, Iterable, Iterator  # Типизация для лучшей читаемости кода
 
-# Проверяет установку библиотеки jira
+# Быстрая C-библиотека для JSON кэша (если установлена, иначе стандартный json)
 try:
-    from jira import JIRA                # Основной класс для работы с JIRA API
-    from jira.exceptions import JIRAError  # Класс для обработки ошибок JIRA
-    JIRA_AVAILABLE = True                # Флаг: библиотека установлена
+    import orjson                        # Сериализация JSON сразу в байты UTF-8
+    ORJSON_AVAILABLE = True              # Флаг: библиотека установлена
 except ImportError:
-    JIRA_AVAILABLE = False               # Флаг: библиотека не установлена
+    ORJSON_AVAILABLE = False             # Флаг: используется стандартный json
+
+# Проверяет установку библиотеки jira (сам импорт откладывается до сетевого запроса)
+JIRA_AVAILABLE = importlib.util.find_spec("jira") is not None  # Флаг: библиотека установлена
+if not JIRA_AVAILABLE:
     print("[ВНИМАНИЕ] Установите библиотеку: pip install jira")  
 
+# Поля задачи, которые читает _issues_to_columns (остальные поля не запрашиваются)
+_ISSUE_FIELDS = "summary,created,resolutiondate,status,priority,reporter,assignee"
+
+# Колонки, в которых хранятся загруженные задачи (и в кэше, и в DataFrame)
+_ISSUE_COLUMNS = ('key', 'summary', 'created', 'status', 'priority', 'resolved', 'reporter', 'assignee')
+
+# Размер страницы при поиске и число потоков для параллельной загрузки страниц
+_BATCH_SIZE = 100
+_MAX_FETCH_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=8)
+def _cache_filename(cache_dir: str, project_key: str, cache_key: str) -> str:
+    """Полный путь к файлу кэша (вычисляется один раз для каждого ключа)."""
+    safe_key = cache_key.replace('/', '_').replace(':', '_')  # Заменяет небезопасные символы
+    return os.path.join(cache_dir, f"{project_key}_{safe_key}.json")  # Полный путь
+
 
 class JiraClient:
     """Клиент для подключения к JIRA и загрузки данных."""
@@ -39,131 +65,236 @@ class JiraClient:
         
         # Клиент JIRA (создаётся при первом использовании)
         self._jira = None                              # Инициализирует как None
+        self._jira_lock = threading.Lock()             # Задачи могут загружаться из разных потоков
         
         # Настройки кэширования
+        self.use_cache = jira_config.get("use_cache", True)  # Включено ли кэширование
         self.cache_dir = "data/cache"                 # Папка для хранения кэшированных данных
-        self.cache_duration = timedelta(hours=1)      # Кэш действителен 1 час
-        
-        # Создаёт папку для кэша если её нет
-        if not os.path.exists(self.cache_dir):        # Проверяет существует ли папка
-            os.makedirs(self.cache_dir)               # Создаёт папку и все родительские
+        # Срок действия кэша (по умолчанию 1 час)
+        self.cache_duration = timedelta(hours=jira_config.get("cache_ttl_hours", 1))
+        self._cache_duration_seconds = self.cache_duration.total_seconds()  # То же в секундах
+        # Файл кэша -> момент (time.monotonic), до которого он точно актуален
+        self._cache_valid_memo: Dict[str, float] = {}
     
     def get_jira_client(self):
         """Создаёт подключение к JIRA."""
-        if self._jira is None:                        # Если клиент ещё не создан
-            try:
-                # Подключение к JIRA (анонимное для публичных серверов)
-                self._jira = JIRA(server={'server': self.server})  # Создаёт объект JIRA
-                self.logger.info(f"Подключение к JIRA: {self.server}")  # Логирует подключение
-            except Exception as e:
-                self.logger.error(f"Ошибка подключения: {e}")  # Логирует ошибку
-                raise                                         # Пробрасывает исключение дальше
+        with self._jira_lock:                         # Одно подключение на все потоки
+            if self._jira is None:                    # Если клиент ещё не создан
+                from jira import JIRA                 # Основной класс для работы с JIRA API
+                try:
+                    # Подключение к JIRA (анонимное для публичных серверов)
+                    self._jira = JIRA(server={'server': self.server})  # Создаёт объект JIRA
+                    self.logger.info(f"Подключение к JIRA: {self.server}")  # Логирует подключение
+                except Exception as e:
+                    self.logger.error(f"Ошибка подключения: {e}")  # Логирует ошибку
+                    raise                                     # Пробрасывает исключение дальше
         return self._jira                                     # Возвращает созданный клиент
     
+    def _ensure_cache_dir(self) -> None:
+        """Создаёт папку для кэша (только перед первой записью)."""
+        os.makedirs(self.cache_dir, exist_ok=True)    # Создаёт папку и все родительские
+    
     def _get_cache_filename(self, cache_key: str) -> str:
         """Генерирует имя файла для кэша."""
-        safe_key = cache_key.replace('/', '_').replace(':', '_')  # Заменяет небезопасные символы
-        return os.path.join(self.cache_dir, f"{self.project_key}_{safe_key}.json")  # Полный путь
+        return _cache_filename(self.cache_dir, self.project_key, cache_key)
     
     def _is_cache_valid(self, cache_file: str) -> bool:
         """Проверяет актуальность кэша."""
-        if not os.path.exists(cache_file):            # Если файл не существует
+        # Повторная проверка в рамках одного запуска без обращения к файловой системе
+        deadline = self._cache_valid_memo.get(cache_file)
+        if deadline is not None and time.monotonic() < deadline:
+            return True                               # Кэш ещё актуален
+        
+        # Один вызов stat и для проверки существования, и для времени изменения
+        try:
+            st = os.stat(cache_file)
+        except FileNotFoundError:                     # Если файл не существует
             return False                              # Кэш невалиден
         
-        # Проверяет время последнего изменения файла
-        cache_time = datetime.fromtimestamp(os.path.getmtime(cache_file))  # Время изменения файла
-        return datetime.now() - cache_time < self.cache_duration  # Сравнивает с текущим временем
+        # Проверяет время последнего изменения файла (в секундах, без объектов datetime)
+        age = time.time() - st.st_mtime               # Возраст кэша
+        if age < self._cache_duration_seconds:        # Сравнивает со сроком действия
+            # Запоминает, сколько ещё кэш будет актуален
+            self._cache_valid_memo[cache_file] = time.monotonic() + (self._cache_duration_seconds - age)
+            return True
+        return False
     
-    def _load_from_cache(self, cache_file: str) -> List[Dict]:
+    def _load_from_cache(self, cache_file: str) -> Dict[str, List]:
         """Загружает данные из кэша."""
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:  # Открывает файл для чтения
-                return json.load(f)                             # Загружает JSON данные
+            with open(cache_file, 'rb') as f:                   # Открывает файл для чтения
+                raw = f.read()                                  # Читает файл целиком в байты
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(raw)                        # Загружает JSON данные (orjson)
+            else:
+                data = json.loads(raw)                          # Загружает JSON данные
         except (json.JSONDecodeError, FileNotFoundError):       # Если файл повреждён или не найден
-            return []                                           # Возвращает пустой список
+            return {}                                           # Возвращает пустой словарь
+        
+        if isinstance(data, list):                              # Старый формат кэша: список словарей
+            return self._records_to_columns(data)
+        return data
     
-    def _save_to_cache(self, cache_file: str, data: List[Dict]) -> None:
+    def _save_to_cache(self, cache_file: str, data: Dict[str, List]) -> None:
         """Сохраняет данные в кэш."""
+        self._cache_valid_memo.pop(cache_file, None)   # Файл перезаписывается - проверить заново
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:  # Открывает файл для записи
-                json.dump(data, f, ensure_ascii=False, indent=2)  # Сохраняет данные в JSON
+            self._ensure_cache_dir()                            # Создаёт папку кэша при необходимости
+            # Кэш читает только программа, поэтому JSON сохраняется без отступов.
+            # Объект пишется по одной колонке, чтобы в памяти не держать весь JSON сразу
+            if ORJSON_AVAILABLE:
+                with open(cache_file, 'wb') as f:               # Открывает файл для записи
+                    f.write(b'{')
+                    for i, (column, values) in enumerate(data.items()):
+                        if i:
+                            f.write(b',')
+                        f.write(orjson.dumps(column) + b':')    # Имя колонки
+                        f.write(orjson.dumps(values))           # Значения колонки
+                    f.write(b'}')
+            else:
+                with open(cache_file, 'w', encoding='utf-8') as f:  # Открывает файл для записи
+                    f.write('{')
+                    for i, (column, values) in enumerate(data.items()):
+                        if i:
+                            f.write(',')
+                        f.write(json.dumps(column) + ':')       # Имя колонки
+                        json.dump(values, f, ensure_ascii=False)  # Значения колонки
+                    f.write('}')
         except Exception as e:
             self.logger.error(f"Ошибка сохранения кэша: {e}")   # Логирует ошибку сохранения
     
-    def get_closed_issues(self, max_results: int = None) -> List[Dict]:
+    def _search_issues(self, jira, jql: str, max_results: int) -> Iterator[Any]:
         """
-        Загружает закрытые задачи проекта.
+        Постраничный поиск задач по JQL.
+        
+        Первая страница загружается отдельно: из неё известно общее
+        количество задач, после чего остальные страницы запрашиваются
+        параллельно. Задачи отдаются по мере получения страниц, поэтому
+        список всех объектов JIRA целиком в памяти не собирается.
         
         Args:
+            jira: Подключение к JIRA
+            jql: JQL запрос
             max_results: Максимальное количество задач
             
-        Returns:
-            List[Dict]: Список задач
+        Yields:
+            Задачи JIRA в порядке выдачи сервера (не больше max_results)
         """
-        if not JIRA_AVAILABLE:                          # Проверяет библиотеку
-            self.logger.error("Библиотека jira не установлена")  # Логирует ошибку
-            return []                                            # Возвращает пустой список
+        first = jira.search_issues(                       # Первая страница
+            jql,                                          # JQL запрос
+            startAt=0,                                    # С первой задачи
+            maxResults=min(_BATCH_SIZE, max_results),     # Сколько задач взять
+            fields=_ISSUE_FIELDS                          # Только нужные поля
+        )
+        first_page = list(first)                          # Задачи первой страницы
+        if not first_page:                                # Если задач нет
+            return
         
-        if max_results is None:                          # Если не указано количество
-            max_results = self.max_issues                # Использует значение из конфигурации
+        # Сервер может отдавать меньше задач на страницу, чем запрошено
+        page_size = len(first_page)
+        total = min(getattr(first, 'total', page_size), max_results)  # Сколько задач всего загрузить
+        offsets = list(range(page_size, total, page_size))  # Начало каждой следующей страницы
         
-        cache_key = f"closed_issues_{max_results}"       # Уникальный ключ для кэша
-        cache_file = self._get_cache_filename(cache_key)  # Полный путь к файлу кэша
+        def fetch_page(start_at: int):
+            return jira.search_issues(
+                jql,
+                startAt=start_at,                         # С какой задачи начинать
+                maxResults=min(page_size, total - start_at),  # Сколько задач взять
+                fields=_ISSUE_FIELDS
+            )
         
-        # Загрузка из кэша
-        if self._is_cache_valid(cache_file):             # Если кэш актуален
+        loaded = min(page_size, total)                    # Сколько задач уже отдано
+        yield from first_page[:total]                     # Не больше max_results
+        self.logger.info(f"Загружено {loaded}/{total} задач...")  # Прогресс
+        
+        if len(offsets) < 2:                              # Одна страница - без пула потоков
+            pages = map(fetch_page, offsets)
+            executor = None
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(offsets)))
+            pages = executor.map(fetch_page, offsets)     # Результаты в порядке startAt
+        
+        try:
+            for page in pages:                            # Отдаёт страницы по порядку
+                page = list(page)[:total - loaded]        # Не больше max_results
+                loaded += len(page)
+                yield from page
+                self.logger.info(f"Загружено {loaded}/{total} задач...")  # Прогресс
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+    
+    def _fetch_issues(self, jql: str, cache_key: str, max_results: int) -> Dict[str, List]:
+        """
+        Загружает задачи по JQL запросу (из кэша или из JIRA).
+        
+        Args:
+            jql: JQL запрос
+            cache_key: Уникальный ключ для кэша
+            max_results: Максимальное количество задач
+            
+        Returns:
+            Dict[str, List]: Задачи по колонкам (имя поля -> список значений)
+        """
+        # Ключ кэша дополняется хэшем сервера и JQL: изменённый запрос не возьмёт старые данные
+        query_hash = hashlib.sha1(f"{self.server}|{jql}".encode('utf-8')).hexdigest()[:10]
+        cache_file = self._get_cache_filename(f"{cache_key}_{query_hash}")  # Полный путь к файлу кэша
+        
+        # Загрузка из кэша (не требует библиотеки jira и подключения)
+        if self.use_cache and self._is_cache_valid(cache_file):  # Если кэш актуален
             cached_data = self._load_from_cache(cache_file)  # Загружает данные
             if cached_data:                               # Если данные не пустые
-                self.logger.info(f"Данные загружены из кэша: {len(cached_data)} задач")  # Логирует
+                self.logger.info(f"Данные загружены из кэша: {len(cached_data['key'])} задач")  # Логирует
                 return cached_data                        # Возвращает кэшированные данные
         
+        if not JIRA_AVAILABLE:                          # Проверяет библиотеку
+            self.logger.error("Библиотека jira не установлена")  # Логирует ошибку
+            return {}                                            # Возвращает пустой словарь
+        
         # Загружает из JIRA
-        self.logger.info(f"Загрузка закрытых задач проекта {self.project_key}...")  # Логируем начало
+        self.logger.info(f"Загрузка задач проекта {self.project_key}: {jql}")  # Логирует начало
+        
+        from jira.exceptions import JIRAError           # Класс для обработки ошибок JIRA
         
         try:
             jira = self.get_jira_client()                # Получает подключение к JIRA
             
-            # JQL запрос для получения закрытых задач
-            jql = f'project = {self.project_key} AND status = Closed ORDER BY created DESC'
-            
-            issues = []                                   # Список для хранения задач
-            start_at = 0                                  # Начальная позиция для пагинации
-            batch_size = 100                              # Размер пачки за один запрос
-            
-            while len(issues) < max_results:              # Пока не набрали нужное количество
-                batch = jira.search_issues(               # Поиск задач
-                    jql,                                  # JQL запрос
-                    startAt=start_at,                     # С какой задачи начинать
-                    maxResults=min(batch_size, max_results - len(issues)),  # Сколько задач взять
-                    fields="*all"                         # Загружает все поля
-                )
-                
-                if not batch:                             # Если нет больше задач
-                    break                                 # Прерывает цикл
-                
-                for issue in batch:                       # Для каждой задачи в пачке
-                    issues.append(self._issue_to_dict(issue))  # Преобразует и добавляем в список
-                
-                start_at += len(batch)                    # Сдвигает позицию для следующей пачки
-                self.logger.info(f"Загружено {len(issues)}/{max_results} задач...")  # Прогресс
-                
-                if len(batch) < batch_size:               # Если получил меньше batch_size
-                    break                                 # Значит больше задач нет
+            # Задачи сразу раскладываются по колонкам
+            issues = self._issues_to_columns(self._search_issues(jira, jql, max_results))
             
-            self._save_to_cache(cache_file, issues)       # Сохраняет загруженные данные
-            
-            self.logger.info(f"Загружено {len(issues)} закрытых задач")  # Финальное сообщение
-            return issues                                 # Возвращает список задач
+            if self.use_cache:
+                self._save_to_cache(cache_file, issues)   # Сохраняет загруженные данные
+            return issues                                 # Возвращает задачи
             
         except JIRAError as e:                            # Если ошибка JIRA API
             self.logger.error(f"Ошибка JIRA: {e}")        # Логирует ошибку
-            return []                                     # Возвращает пустой список
+            return {}                                     # Возвращает пустой словарь
         except Exception as e:                            # Любая другая ошибка
             self.logger.error(f"Ошибка: {e}")             # Логирует ошибку
-            return []                                     # Возвращает пустой список
+            return {}                                     # Возвращает пустой словарь
+    
+    def get_closed_issues(self, max_results: int = None) -> Dict[str, List]:
+        """
+        Загружает закрытые задачи проекта.
+        
+        Args:
+            max_results: Максимальное количество задач
+            
+        Returns:
+            Dict[str, List]: Задачи по колонкам (имя поля -> список значений)
+        """
+        if max_results is None:                          # Если не указано количество
+            max_results = self.max_issues                # Использует значение из конфигурации
+        
+        # JQL запрос для получения закрытых задач
+        jql = f'project = {self.project_key} AND status = Closed ORDER BY created DESC'
+        issues = self._fetch_issues(jql, f"closed_issues_{max_results}", max_results)
+        
+        self.logger.info(f"Загружено {len(issues.get('key', []))} закрытых задач")  # Финальное сообщение
+        return issues                                    # Возвращает задачи
     
     #Загрузка всех задач
-    def get_all_issues(self, max_results: int = None) -> List[Dict]:
+    def get_all_issues(self, max_results: int = None) -> Dict[str, List]:
         """
         Загружает ВСЕ задачи проекта (включая открытые, в работе и закрытые).
         Используется для графиков, где нужны все задачи:
@@ -175,111 +306,58 @@ class JiraClient:
             max_results: Максимальное количество задач
             
         Returns:
-            List[Dict]: Список задач с различными статусами
+            Dict[str, List]: Задачи с различными статусами по колонкам
         """
-        if not JIRA_AVAILABLE:                          # Проверяет библиотеку
-            self.logger.error("Библиотека jira не установлена")
-            return []
-        
         if max_results is None:                          # Если не указано количество
             max_results = self.max_issues                # Использует значение из конфигурации
         
-        cache_key = f"all_issues_{max_results}"          # Уникальный ключ для кэша (отличается от закрытых!)
-        cache_file = self._get_cache_filename(cache_key)  # Полный путь к файлу кэша
-        
-        # Загрузка из кэша
-        if self._is_cache_valid(cache_file):             # Если кэш актуален
-            cached_data = self._load_from_cache(cache_file)  # Загружает данные
-            if cached_data:                               # Если данные не пустые
-                self.logger.info(f"Данные загружены из кэша: {len(cached_data)} задач")
-                return cached_data                        # Возвращает кэшированные данные
+        # JQL запрос для получения ВСЕХ задач
+        jql = f'project = {self.project_key} ORDER BY created DESC'
+        # Ключ кэша отличается от закрытых задач!
+        issues = self._fetch_issues(jql, f"all_issues_{max_results}", max_results)
         
-        # Загружает из JIRA
-        self.logger.info(f"Загрузка ВСЕХ задач проекта {self.project_key}...")  # Логирует начало
+        # Анализирует полученные статусы для отладки
+        if issues:
+            statuses = set(filter(None, issues['status']))
+            self.logger.info(f"Загружено {len(issues['key'])} задач со статусами: {list(statuses)}")
+        else:
+            self.logger.warning(f"Не загружено ни одной задачи проекта {self.project_key}")
         
-        try:
-            jira = self.get_jira_client()                # Получает подключение к JIRA
-            
-            # JQL запрос для получения ВСЕХ задач
-            jql = f'project = {self.project_key} ORDER BY created DESC'
-            
-            issues = []                                   # Список для хранения задач
-            start_at = 0                                  # Начальная позиция для пагинации
-            batch_size = 100                              # Размер пачки за один запрос
-            
-            while len(issues) < max_results:              # Пока не набрали нужное количество
-                batch = jira.search_issues(               # Поиск задач
-                    jql,                                  # JQL запрос (ВСЕ задачи)
-                    startAt=start_at,                     # С какой задачи начинать
-                    maxResults=min(batch_size, max_results - len(issues)),  # Сколько задач взять
-                    fields="*all"                         # Загружаем все поля
-                )
-                
-                if not batch:                             # Если нет больше задач
-                    break                                 # Прерываем цикл
-                
-                for issue in batch:                       # Для каждой задачи в пачке
-                    issues.append(self._issue_to_dict(issue))  # Преобразуем и добавляем в список
-                
-                start_at += len(batch)                    # Сдвигает позицию для следующей пачки
-                self.logger.info(f"Загружено {len(issues)}/{max_results} задач...")  # Прогресс
-                
-                if len(batch) < batch_size:               # Если получили меньше batch_size
-                    break                                 # Значит больше задач нет
-            
-            self._save_to_cache(cache_file, issues)       # Сохраняет загруженные данные
-            
-            # Анализирует полученные статусы для отладки
-            if issues:
-                statuses = set()
-                for issue in issues:
-                    if 'status' in issue and issue['status']:
-                        statuses.add(issue['status'])
-                self.logger.info(f"Загружено {len(issues)} задач со статусами: {list(statuses)}")
-            else:
-                self.logger.warning(f"Не загружено ни одной задачи проекта {self.project_key}")
-            
-            return issues                                 # Возвращает список задач
-            
-        except JIRAError as e:                            # Если ошибка JIRA API
-            self.logger.error(f"Ошибка JIRA: {e}")
-            return []                                     # Возвращает пустой список
-        except Exception as e:                            # Любая другая ошибка
-            self.logger.error(f"Ошибка: {e}")
-            return []                                     # Возвращает пустой список
+        return issues                                    # Возвращает задачи
     
-    def _issue_to_dict(self, issue) -> Dict[str, Any]:
-        """Преобразует объект задачи JIRA в словарь."""
-        fields = issue.fields                             # Получает поля задачи
-        
-        issue_dict = {                                    # Создаёт словарь с основными полями
-            'key': issue.key,                             # Ключ задачи (например "KAFKA-123")
-            'summary': fields.summary,                    # Заголовок задачи
-            'created': fields.created,                    # Дата создания
-            'status': fields.status.name if fields.status else None,  # Статус
-            'priority': fields.priority.name if fields.priority else None,  # Приоритет
-        }
+    def _issues_to_columns(self, issues: Iterable[Any]) -> Dict[str, List]:
+        """
+        Раскладывает задачи JIRA по колонкам (имя поля -> список значений).
         
-        # Дата закрытия и время выполнения (только для закрытых задач)
-        if fields.resolutiondate:                         # Если задача закрыта
-            issue_dict['resolved'] = fields.resolutiondate  # Дата закрытия
-            try:
-                # Преобразует строки в объекты datetime
-                created = datetime.fromisoformat(fields.created.replace('Z', '+00:00'))
-                resolved = datetime.fromisoformat(fields.resolutiondate.replace('Z', '+00:00'))
-                # Вычисляет время выполнения в часах
-                issue_dict['open_time_hours'] = (resolved - created).total_seconds() / 3600
-            except (ValueError, AttributeError):          # Если не удалось преобразовать
-                issue_dict['open_time_hours'] = None      # Устанавливает None
-        else:
-            # Для незакрытых задач время выполнения не вычисляет
-            issue_dict['resolved'] = None
-            issue_dict['open_time_hours'] = None
+        Принимает любой итерируемый источник (в том числе генератор
+        _search_issues), так что задачи попадают в колонки сразу при
+        загрузке страниц. Колонки передаются в pd.DataFrame как есть,
+        без промежуточного списка словарей по одной задаче.
+        """
+        keys, summaries, created, statuses = [], [], [], []
+        priorities, resolved, reporters, assignees = [], [], [], []
         
-        # Автор и исполнитель
-        if fields.reporter:                               # Если есть автор
-            issue_dict['reporter'] = fields.reporter.displayName  # Имя автора
-        if fields.assignee:                               # Если есть исполнитель
-            issue_dict['assignee'] = fields.assignee.displayName  # Имя исполнителя
+        for issue in issues:
+            fields = issue.fields                         # Получает поля задачи
+            keys.append(issue.key)                        # Ключ задачи (например "KAFKA-123")
+            summaries.append(fields.summary)              # Заголовок задачи
+            created.append(fields.created)                # Дата создания
+            statuses.append(fields.status.name if fields.status else None)  # Статус
+            priorities.append(fields.priority.name if fields.priority else None)  # Приоритет
+            # Дата закрытия (только для закрытых задач)
+            # Время выполнения вычисляется уже по таблице в DataProcessor
+            resolved.append(fields.resolutiondate or None)
+            # Автор и исполнитель
+            reporters.append(fields.reporter.displayName if fields.reporter else None)
+            assignees.append(fields.assignee.displayName if fields.assignee else None)
         
-        return issue_dict                                 # Возвращает готовый словарь
\ No newline at end of file
+        if not keys:                                      # Нет задач - нет данных
+            return {}
+        return dict(zip(_ISSUE_COLUMNS, (keys, summaries, created, statuses,
+                                         priorities, resolved, reporters, assignees)))
+    
+    def _records_to_columns(self, records: List[Dict]) -> Dict[str, List]:
+        """Преобразует список словарей (старый формат кэша) в колонки."""
+        if not records:
+            return {}
+        return {col: [record.get(col) for record in records] for col in _ISSUE_COLUMNS}
\ No newline at end of file
@@ -1,17 +1,14 @@
 import sys    # Для работы с системными параметрами и завершения программы
 import os     # Для работы с файловой системой и путями
 import logging   # Для ведения логов (записей о работе программы)
-
-# Путь к корневой папке проекта в путь поиска модулей
-# Чтобы Python мог находить наши модули в папке src/
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from collections import ChainMap  # Объединение словарей без копирования
+from concurrent.futures import ThreadPoolExecutor  # Для одновременной загрузки наборов задач
 
 # Импортирование наших собственных модулей
+# JiraClient, DataProcessor и PlotBuilder (pandas, matplotlib) импортируются
+# внутри main() непосредственно перед использованием
 try:
     from src.config import get_config      # Функция для загрузки конфигурации
-    from src.jira_client import JiraClient  # Класс для работы с JIRA API
-    from src.data_processor import DataProcessor  # Класс для обработки данных
-    from src.plot_builder import PlotBuilder  # Класс для построения графиков - ДОБАВЛЕН!
     IMPORT_SUCCESS = True  # Флаг: все модули успешно импортированы
 except ImportError as e:
     # Если какой-то модуль не найден (ещё не реализован)
@@ -29,29 +26,100 @@ def setup_logging(config):
         # Формат вывода логов
         # Берёт из конфигурации или использует простой формат
         format=config.get("logging", {}).get("format", "%(message)s"),
+        # Повторный вызов (после загрузки конфигурации) заменяет начальные настройки
+        force=True,
     )
 
 
+def report_missing_module(error):
+    """Сообщение о модуле, который не удалось импортировать (демо-режим)."""
+    print(f"Ошибка: {error}")  # Ошибка
+    print("\n[ВНИМАНИЕ] Не все модули доступны.")
+    print("Это демонстрационная версия программы.")
+    return 0  # Завершает программу успешно (демо-версия)
+
+
+# Заголовок программы (текст собирается один раз при импорте)
+_BANNER = (
+    "\n" + "="*50 + "\n"  # Верхняя разделительная линия
+    "JIRA ANALYTICS TOOL\n"  # Название программы
+    + "="*50 + "\n\n"  # Нижняя разделительная линия
+)
+
+# Итоговое сообщение со списком всех графиков
+_SUMMARY = (
+    "\n" + "="*60 + "\n"
+    "ВСЕ 6 ГРАФИКОВ УСПЕШНО ПОСТРОЕНЫ\n"
+    + "="*60 + "\n"
+    "\nСозданные графики:\n"
+    "1. open_time_histogram.png     - Время в открытом состоянии (закрытые задачи)\n"
+    "2. status_times.png            - Распределение по состояниям (закрытые задачи)\n"
+    "3. daily_tasks.png             - Задачи по дням с накопительным итогом (все задачи)\n"
+    "4. top_users.png               - Топ-30 пользователей (все задачи)\n"
+    "5. logged_time_histogram.png   - Залогированное время (закрытые задачи)\n"
+    "6. priority_distribution.png   - Распределение по приоритетам (все задачи)\n"
+    "\n" + "="*60 + "\n"
+    "Графики сохранены в папке 'reports/'\n"
+    + "="*60 + "\n"
+    "\nПримечания:\n"
+    "• Графики 1, 2, 5 строятся на закрытых задачах\n"
+    "• Графики 3, 4, 6 строятся на всех задачах\n"
+    "• Графики 5 и 6 являются упрощёнными версиями\n"
+    "• Для полной реализации требуется доступ к worklog и changelog JIRA\n"
+    "• Для просмотра графиков откройте файлы в папке 'reports/'\n"
+)
+
+# Итоговое сообщение для render_mode: json (изображения не создаются)
+_SUMMARY_JSON = (
+    "\n" + "="*60 + "\n"
+    "ДАННЫЕ 6 ГРАФИКОВ УСПЕШНО ПОДГОТОВЛЕНЫ\n"
+    + "="*60 + "\n"
+    "\nФайл plots.json в папке отчётов (visualization.output_dir):\n"
+    "• Ключи - графики 1-6 (1_open_time_histogram ... 6_priority_distribution)\n"
+    "• Значения - фигуры Plotly: {'data': [...], 'layout': {...}}\n"
+    "• Отрисовка в браузере: Plotly.newPlot(div, figure.data, figure.layout)\n"
+    + "="*60 + "\n"
+)
+
+
 def print_banner():
-    """Вывод заголовка программы при запуске."""
-    print("\n" + "="*50)  # Верхняя разделительная линия
-    print("JIRA ANALYTICS TOOL")  # Название программы
-    print("="*50 + "\n")  # Нижняя разделительная линия
+    """Вывод заголовка программы при запуске (одной записью в stdout)."""
+    sys.stdout.write(_BANNER)
+
+
+def print_stage(title):
+    """
+    Вывод заголовка этапа.
+    
+    Вывод внутри этапа накапливается в буфере stdout и выводится
+    одним блоком при переходе к следующему этапу.
+    """
+    sys.stdout.flush()  # Выводит накопленные сообщения предыдущего этапа
+    print(title)
+    sys.stdout.flush()  # Заголовок этапа виден сразу
 
 
 def main():
     """Главная функция программы - точка входа."""
+    # Блочная буферизация stdout вместо построчной (сброс - в print_stage)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
     print_banner()  # Выводим красивый заголовок
+    # Логирование по умолчанию до загрузки конфигурации (покрывает и её ошибки)
+    setup_logging({})
     
     try:
         # 1. Загрузка конфигурации
-        print("[1/8] Загрузка конфигурации...")  # Шаг 1 из 8 
+        print_stage("[1/8] Загрузка конфигурации...")  # Шаг 1 из 8 
         config = get_config()  # Получает настройки из config.py
         jira_config = config.get("jira", {})  # Извлекаем настройки JIRA
+        project_key = jira_config.get('project_key', 'KAFKA')  # Ключ проекта
+        server = jira_config.get('server', 'https://issues.apache.org/jira')  # Адрес сервера
+        max_issues_cfg = jira_config.get('max_issues', 1000)  # Лимит задач из конфигурации
         # Выводит информацию о проекте и сервере
-        print(f"Проект: {jira_config.get('project_key', 'KAFKA')}")
-        print(f"Сервер: {jira_config.get('server', 'https://issues.apache.org/jira')}")
-        print(f"Максимум задач: {jira_config.get('max_issues', 1000)}")
+        print(f"Проект: {project_key}")
+        print(f"Сервер: {server}")
+        print(f"Максимум задач: {max_issues_cfg}")
         
         setup_logging(config)  # Настраивает систему логирования
         
@@ -62,17 +130,29 @@ def main():
             return 0  # Завершает программу успешно (демо-версия)
         
         # 2. Подключение к JIRA
-        print("\n[2/8] Подключение к JIRA...")
+        print_stage("\n[2/8] Подключение к JIRA...")
+        try:
+            from src.jira_client import JiraClient  # Класс для работы с JIRA API
+        except ImportError as e:
+            return report_missing_module(e)
         jira_client = JiraClient(config)  # Создает клиент для работы с JIRA
         
          # 3. Загрузка задач (для демонстрации загружает разумное количество)
         print("   Загрузка задач...")
         
-        # Загружаем два набора данных
+        # Загружаем два набора данных одновременно (оба запроса ждут сеть)
         # 3.1 Для графиков 1, 2, 5 -  закрытые задачи
         print("   a) Загрузка закрытых задач...")
-        max_closed = min(jira_config.get('max_issues', 1000), 500)  # Не более 500 для скорости
-        closed_issues = jira_client.get_closed_issues(max_results=max_closed)
+        max_closed = min(max_issues_cfg, 500)  # Не более 500 для скорости
+        # 3.2 Для графиков 3, 4, 6 - ВСЕ задачи (открытые, в работе и закрытые)
+        print("   b) Загрузка всех задач...")
+        max_all = min(max_issues_cfg, 500)  
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            closed_future = executor.submit(jira_client.get_closed_issues, max_results=max_closed)
+            all_future = executor.submit(jira_client.get_all_issues, max_results=max_all)
+            closed_issues = closed_future.result()
+            all_issues = all_future.result()
         
         # Проверка, удалось ли загрузить закрытые задачи
         if not closed_issues:
@@ -83,12 +163,6 @@ def main():
             print("\n   Программа завершена, так как нет данных для анализа.")
             return 1  # Завершаем с ошибкой
         
-        # 3b. Для графиков 3, 4, 6 - ВСЕ задачи (открытые, в работе и закрытые)
-        print("   b) Загрузка всех задач...")
-        max_all = min(jira_config.get('max_issues', 1000), 500)  
-        
-        all_issues = jira_client.get_all_issues(max_results=max_all)
-        
         # Проверка, удалось ли загрузить все задачи
         if not all_issues:
             print("   ВНИМАНИЕ: Не удалось загрузить все задачи.")
@@ -96,33 +170,57 @@ def main():
             all_issues = closed_issues  # Fallback на закрытые задачи
             print("   Рекомендуется проверить подключение к JIRA API.")
         else:
-            # Анализируем состав задач для информативности
-            closed_count = sum(1 for issue in all_issues if issue.get('status') == 'Closed')
-            other_count = len(all_issues) - closed_count
-            print(f"   Загружено {len(all_issues)} задач: {closed_count} закрытых, {other_count} с другими статусами")
+            import pandas as pd  # Для подсчёта статусов одним проходом
             
-            # Собираем уникальные статусы для отображения
-            unique_statuses = set()
-            for issue in all_issues:
-                if issue.get('status'):
-                    unique_statuses.add(issue['status'])
+            # Анализируем состав задач для информативности (один подсчёт по всем статусам)
+            statuses = pd.Series(all_issues['status'], dtype='category')
+            status_counts = statuses.value_counts(dropna=True)
+            closed_count = int(status_counts.get('Closed', 0))
+            other_count = len(all_issues['key']) - closed_count
+            print(f"   Загружено {len(all_issues['key'])} задач: {closed_count} закрытых, {other_count} с другими статусами")
+            
+            # Уникальные статусы для отображения (категории уже отсортированы при создании)
+            unique_statuses = statuses.cat.categories.tolist()
             if unique_statuses:
-                print(f"   Найдены статусы: {', '.join(sorted(unique_statuses))}")
+                print(f"   Найдены статусы: {', '.join(unique_statuses)}")
+        
+        fallback = all_issues is closed_issues  # Оба набора - одни и те же данные
         
-        print(f"   Загружено {len(closed_issues)} закрытых задач")
-        if all_issues != closed_issues:
-            print(f"   Загружено {len(all_issues)} всех задач (включая разные статусы)")
+        print(f"   Загружено {len(closed_issues['key'])} закрытых задач")
+        if not fallback:
+            print(f"   Загружено {len(all_issues['key'])} всех задач (включая разные статусы)")
         
         # 4. Обработка данных
-        print("\n[3/8] Обработка данных...")
+        print_stage("\n[3/8] Обработка данных...")
+        try:
+            from src.data_processor import DataProcessor  # Класс для обработки данных
+        except ImportError as e:
+            return report_missing_module(e)
         data_processor = DataProcessor(config)  # Создает обработчик данных
         
         # Создаем два DataFrame
         # 4.1 DataFrame для закрытых задач (графики 1, 2, 5)
-        df_closed = data_processor.create_dataframe(closed_issues)
-        
         # 4.2 DataFrame для всех задач (графики 3, 4, 6)
-        df_all = data_processor.create_dataframe(all_issues)
+        # В режиме fallback данные те же, поэтому таблица не строится повторно
+        # Если загружены все задачи проекта (лимит не достигнут), закрытые задачи -
+        # их подмножество, и их строки не обрабатываются второй раз
+        all_complete = not fallback and len(all_issues['key']) < max_all
+        if fallback:
+            df_closed = data_processor.create_dataframe(closed_issues)
+            df_all = df_closed
+        elif all_complete:
+            df_all = data_processor.create_dataframe(all_issues)
+            if 'status' in df_all.columns:
+                # Порядок строк тот же, что у запроса закрытых задач (по дате создания)
+                df_closed = df_all.loc[df_all['status'] == 'Closed'].head(max_closed)
+            else:
+                df_closed = data_processor.create_dataframe(closed_issues)
+        else:
+            # Таблицы независимы - строятся одновременно
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                closed_future = executor.submit(data_processor.create_dataframe, closed_issues)
+                all_future = executor.submit(data_processor.create_dataframe, all_issues)
+                df_closed, df_all = closed_future.result(), all_future.result()
         
         # Проверяет, есть ли данные для обработки
         if df_closed.empty:
@@ -133,7 +231,7 @@ def main():
         print(f"   Обработано {len(df_all)} всех задач")
         
         # 5. Статистика
-        print("\n[4/8] Анализ статистики...")
+        print_stage("\n[4/8] Анализ статистики...")
         #Статистику считаем только по закрытым задачам (по заданию)
         stats = data_processor.get_statistics(df_closed)
         
@@ -147,63 +245,58 @@ def main():
             print(f"   Максимальное время: {time_stats.get('max', 0):.1f} часов")
         
         # 6. Подготовка данных для графиков
-        print("\n[5/8] Подготовка данных для графиков...")
+        print_stage("\n[5/8] Подготовка данных для графиков...")
         # Подготавливаем данные отдельно для разных наборов
         
         # Для графиков 1, 2, 5 (закрытые задачи)
-        plot_data_closed = data_processor.prepare_for_plotting(df_closed)
-        
         # Для графиков 3, 4, 6 (все задачи)
-        plot_data_all = data_processor.prepare_for_plotting(df_all)
+        if fallback:
+            plot_data_closed = data_processor.prepare_for_plotting(df_closed)
+            plot_data_all = plot_data_closed
+        else:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                closed_future = executor.submit(data_processor.prepare_for_plotting, df_closed)
+                all_future = executor.submit(data_processor.prepare_for_plotting, df_all)
+                plot_data_closed, plot_data_all = closed_future.result(), all_future.result()
         
         # Объединяет данные для передачи в PlotBuilder
-        plot_data = {**plot_data_closed, **plot_data_all}
+        # При совпадении ключей побеждают данные по всем задачам (plot_data_all)
+        plot_data = ChainMap(plot_data_all, plot_data_closed)
         
         print(f"   Подготовлено {len(plot_data)} наборов данных для графиков")
         
         # 7. Создание объекта для построения графиков
-        print("\n[6/8] Инициализация построителя графиков...")
+        print_stage("\n[6/8] Инициализация построителя графиков...")
+        try:
+            from src.plot_builder import PlotBuilder  # Класс для построения графиков
+        except ImportError as e:
+            return report_missing_module(e)
         plot_builder = PlotBuilder(config)  # Создает объект для построения графиков
         
         # 8. Построение всех 6 графиков согласно заданию
-        print("\n[7/8] Построение 6 графиков аналитики...")
+        print_stage("\n[7/8] Построение 6 графиков аналитики...")
         # Передает оба DataFrame в PlotBuilder
         # df_all - для графиков 3, 4, 6
         # df_closed - для графиков 1, 2, 5 (PlotBuilder должен использовать его внутри методов)
         plot_paths = plot_builder.create_all_plots(plot_data, df_all, df_closed)
         
+        json_mode = plot_builder.render_mode == "json"  # Вместо изображений - данные для Plotly
+        
         # Выводит информацию о созданных графиках
-        print(f"   Создано {len(plot_paths)} графиков:")
-        for plot_name, plot_path in plot_paths.items():
-            # Извлекает только имя файла из полного пути
-            filename = os.path.basename(plot_path)
-            print(f"   • {filename}")
+        if json_mode:
+            print(f"   Данные графиков сохранены: {plot_paths['plots_json']}")
+        else:
+            print(f"   Создано {len(plot_paths)} графиков:")
+            # Извлекает только имена файлов из полных путей (один раз для всех графиков)
+            filenames = list(map(os.path.basename, plot_paths.values()))
+            if filenames:
+                print("\n".join(f"   • {filename}" for filename in filenames))
         
         # 9. Завершение работы
-        print("\n[8/8] Программа успешно завершена!")
-        
-        # Выводит итоговое сообщение со списком всех графиков
-        print("\n" + "="*60)
-        print("ВСЕ 6 ГРАФИКОВ УСПЕШНО ПОСТРОЕНЫ")
-        print("="*60)
-        print("\nСозданные графики:")
-        print("1. open_time_histogram.png     - Время в открытом состоянии (закрытые задачи)")
-        print("2. status_times.png            - Распределение по состояниям (закрытые задачи)")
-        print("3. daily_tasks.png             - Задачи по дням с накопительным итогом (все задачи)")
-        print("4. top_users.png               - Топ-30 пользователей (все задачи)")
-        print("5. logged_time_histogram.png   - Залогированное время (закрытые задачи)")
-        print("6. priority_distribution.png   - Распределение по приоритетам (все задачи)")
-        
-        print("\n" + "="*60)
-        print("Графики сохранены в папке 'reports/'")
-        print("="*60)
-        
-        print("\nПримечания:")
-        print("• Графики 1, 2, 5 строятся на закрытых задачах")
-        print("• Графики 3, 4, 6 строятся на всех задачах")
-        print("• Графики 5 и 6 являются упрощёнными версиями")
-        print("• Для полной реализации требуется доступ к worklog и changelog JIRA")
-        print("• Для просмотра графиков откройте файлы в папке 'reports/'")
+        print_stage("\n[8/8] Программа успешно завершена!")
+        
+        # Выводит итоговое сообщение со списком всех графиков (одной записью)
+        sys.stdout.write(_SUMMARY_JSON if json_mode else _SUMMARY)
         
         return 0  # Успешное завершение программы
         
@@ -212,15 +305,16 @@ def main():
         print("\n\n[ИНФО] Работа прервана пользователем")
         return 130  # Стандартный код завершения для Ctrl+C
         
-    except Exception as e:
+    except Exception:
         # Обработка любых других ошибок
-        print(f"\n[ОШИБКА] {e}")
-        import traceback  # Для детальной информации об ошибке
-        traceback.print_exc()  # Выводит полный стек вызовов
+        sys.stdout.flush()  # Накопленный вывод этапа - до сообщения об ошибке
+        # Сообщение и полный стек вызовов форматируются один раз обработчиком логов
+        logging.getLogger(__name__).exception("\n[ОШИБКА] Необработанная ошибка")
         return 1  # Код ошибки
      
 
 if __name__ == "__main__":
     # Точка входа в программу
-    # Выполняется только если файл запущен напрямую (python src/main.py)
+    # Выполняется при запуске модуля из корня проекта (python -m src.main);
+    # после установки (pip install -e .) доступна команда jira-analytics
     sys.exit(main())  # Запускает главную функцию и передает её код возврата в систему
\ No newline at end of file
@@ -2,18 +2,397 @@
 Модуль для построения графиков на основе данных из JIRA.
 Создает 6 графиков согласно заданию лабораторной работы.
 """
+import io
 import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import matplotlib
+matplotlib.use("Agg")  # Графики только сохраняются в файлы: без поиска GUI-бэкенда при импорте pyplot
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import Collection, PolyCollection
 import seaborn as sns
 import pandas as pd
 import numpy as np
+from PIL import Image  # Нарезка дашборда на отдельные графики (Pillow ставится вместе с matplotlib)
 from typing import Dict, Any, Optional
 import logging
 
+# Подсчёт гистограмм с равными интервалами без бинарного поиска (если установлена, иначе np.histogram)
+try:
+    from fast_histogram import histogram1d  # Номер интервала вычисляется напрямую
+    FAST_HISTOGRAM_AVAILABLE = True          # Флаг: библиотека установлена
+except ImportError:
+    FAST_HISTOGRAM_AVAILABLE = False         # Флаг: используется np.histogram
+
+# JIT-компиляция подсчёта гистограммы (если fast_histogram не установлена)
+try:
+    import numba
+    NUMBA_AVAILABLE = True                   # Флаг: библиотека установлена
+except ImportError:
+    NUMBA_AVAILABLE = False                  # Флаг: используется np.histogram
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _hist_counts_jit(data, edges):
+        """
+        Подсчёт по равным интервалам за один проход (верхняя граница включается).
+        
+        Номер интервала вычисляется по масштабу и сверяется с границами edges
+        так же, как в np.histogram: значения на границах попадают в те же интервалы.
+        """
+        n_bins = len(edges) - 1
+        lo, hi = edges[0], edges[-1]
+        counts = np.zeros(n_bins, np.int64)
+        scale = n_bins / (hi - lo)
+        for x in data:
+            if lo <= x <= hi:                # NaN не проходит сравнение
+                b = int((x - lo) * scale)    # Номер интервала без бинарного поиска
+                if b == n_bins:              # Максимальное значение - в последний интервал
+                    b -= 1
+                # Поправка на ошибку округления у границ (как в np.histogram)
+                if x < edges[b]:
+                    b -= 1
+                elif b < n_bins - 1 and x >= edges[b + 1]:
+                    b += 1
+                counts[b] += 1
+        return counts
+
+
+def _hours_array(values) -> np.ndarray:
+    """
+    Время в часах массивом float32.
+    
+    Точности float32 (7 значащих цифр) хватает для часов и подписей с одним знаком
+    после запятой, а массив вдвое меньше float64 - проходы гистограмм и статистики
+    читают вдвое меньше памяти. Целочисленный тип не подходит: есть дробные часы и NaN.
+    
+    Args:
+        values: Время в часах (Series, список или массив)
+        
+    Returns:
+        np.ndarray: Массив float32 (NaN сохраняются)
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+def _prep_hist(values, quantile: float = 0.95, min_filtered: int = 10):
+    """
+    Готовит данные для гистограммы времени за один проход NumPy.
+    
+    Убирает пустые значения и отсекает выбросы выше квантиля
+    (линейная интерполяция, как в pd.Series.quantile). Квантиль
+    ищется через np.partition за O(N), без полной сортировки.
+    
+    Args:
+        values: Время в часах (Series или массив)
+        quantile: Порог отсечения выбросов
+        min_filtered: Если после отсечения осталось меньше значений, используются все
+    
+    Returns:
+        tuple: (все значения без NaN, значения для гистограммы) - массивы float32
+    """
+    arr = _hours_array(values)
+    arr = arr[~np.isnan(arr)]  # Убирает пустые значения
+    if len(arr) == 0:
+        return arr, arr
+    
+    # Квантиль с линейной интерполяцией между двумя соседними элементами
+    pos = (len(arr) - 1) * quantile
+    lo = int(pos)
+    hi = min(lo + 1, len(arr) - 1)
+    part = np.partition(arr, [lo, hi])
+    threshold = part[lo] + (part[hi] - part[lo]) * (pos - lo)
+    
+    filtered = arr[arr <= threshold]  # Исключает выбросы
+    if len(filtered) < min_filtered:  # Если после фильтрации данных мало, используем все
+        filtered = arr
+    return arr, filtered
+
+
+def _add_bars(ax, left, heights, widths, **bar_kwargs) -> PolyCollection:
+    """
+    Добавляет столбцы одной коллекцией PolyCollection вместо отдельного Rectangle на каждый столбец.
+    
+    Вершины всех столбцов собираются одним массивом (N, 4, 2); пределы осей
+    задаются явно по накопленным данным (низ - 0, сверху и по бокам поля 5%, как у ax.bar).
+    
+    Args:
+        ax: Оси matplotlib
+        left: Левые края столбцов
+        heights: Высоты столбцов
+        widths: Ширины столбцов (число или массив)
+        **bar_kwargs: Оформление (color, alpha, label, edgecolor, ...)
+        
+    Returns:
+        PolyCollection: Коллекция столбцов
+    """
+    left = np.asarray(left, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+    right = left + np.asarray(widths, dtype=np.float64)
+    
+    verts = np.empty((len(left), 4, 2))  # Углы прямоугольников по часовой стрелке от левого нижнего
+    verts[:, 0, 0] = verts[:, 1, 0] = left
+    verts[:, 2, 0] = verts[:, 3, 0] = right
+    verts[:, 0, 1] = verts[:, 3, 1] = 0.0
+    verts[:, 1, 1] = verts[:, 2, 1] = heights
+    
+    if 'color' in bar_kwargs:
+        bar_kwargs['facecolor'] = bar_kwargs.pop('color')
+    bars = PolyCollection(verts, **bar_kwargs)
+    ax.add_collection(bars, autolim=False)
+    
+    if len(left) > 0:
+        # Границы данных копятся между вызовами (несколько серий на одних осях)
+        ax.update_datalim([(left.min(), 0.0), (right.max(), max(heights.max(), 0.0))])
+        x0, y0, x1, y1 = ax.dataLim.extents
+        x_pad = (x1 - x0) * 0.05
+        ax.set_xlim(x0 - x_pad, x1 + x_pad)
+        ax.set_ylim(0.0, y1 * 1.05 if y1 > 0 else 1.0)
+    return bars
+
+
+def _hist_counts(data: np.ndarray, n_bins: int):
+    """
+    Подсчёт гистограммы с равными интервалами (fast_histogram, numba или np.histogram).
+    
+    Args:
+        data: Значения без NaN (массив float32)
+        n_bins: Количество интервалов
+        
+    Returns:
+        tuple: (количество в интервалах, границы интервалов)
+    """
+    lo, hi = float(data.min()), float(data.max())
+    if lo == hi:  # Все значения одинаковые - интервал шириной 1, как в np.histogram
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, n_bins + 1)  # Границы интервалов
+    
+    if FAST_HISTOGRAM_AVAILABLE:
+        # Верхняя граница в fast_histogram не включается - сдвигается на минимальный шаг.
+        # Номер интервала считается только по масштабированному значению, без сверки
+        # с границами, поэтому значение точно на внутренней границе может попасть
+        # в соседний интервал (np.histogram относит его к правому) - итоговые суммы
+        # совпадают, разбивка по интервалам может отличаться на единицы
+        counts = histogram1d(data, bins=n_bins, range=(lo, np.nextafter(hi, np.inf)))
+        counts = counts.astype(np.int64)  # histogram1d возвращает float64
+    elif NUMBA_AVAILABLE:
+        counts = _hist_counts_jit(data, edges)
+    else:
+        counts, _ = np.histogram(data, bins=edges)
+    return counts, edges
+
+
+def _draw_hist(ax, data: np.ndarray, n_bins: int, **bar_kwargs):
+    """
+    Строит гистограмму с равными интервалами: подсчёт отдельно, отрисовка одной коллекцией.
+    
+    Args:
+        ax: Оси matplotlib
+        data: Значения без NaN (массив float32)
+        n_bins: Количество интервалов
+        **bar_kwargs: Оформление столбцов (color, alpha, label, ...)
+        
+    Returns:
+        tuple: (количество в интервалах, границы интервалов, коллекция столбцов)
+    """
+    counts, edges = _hist_counts(data, n_bins)
+    bars = _add_bars(ax, edges[:-1], counts, np.diff(edges), edgecolor='black', **bar_kwargs)
+    return counts, edges, bars
+
+
+# Поля фигуры (доли ширины и высоты) задаются заранее вместо tight_layout
+# и bbox_inches='tight': оба требуют дополнительного прохода отрисовки
+_MARGINS = {'left': 0.08, 'right': 0.96, 'top': 0.92, 'bottom': 0.12}
+
+
+def _margins(**overrides) -> Dict[str, float]:
+    """Поля сетки подграфиков: _MARGINS с заменой отдельных значений (hspace, wspace и т.п.)."""
+    return {**_MARGINS, **overrides}
+
+# Оформление стиля 'seaborn-v0_8-darkgrid' (серый фон, белая сетка) прямо в rcParams,
+# без поиска и разбора файла стиля через plt.style.use
+_STYLE = {
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.linewidth': 0,
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.labelcolor': '.15',
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+    'grid.linewidth': 1,
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.major.size': 0,
+    'ytick.major.size': 0,
+    'xtick.minor.size': 0,
+    'ytick.minor.size': 0,
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'lines.solid_capstyle': 'round',
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['DejaVu Sans', 'Arial', 'Helvetica'],
+    'axes.unicode_minus': False,
+    'text.usetex': False,      # Текст рисуется встроенным mathtext, без запуска LaTeX
+    'svg.fonttype': 'none',    # В SVG текст остаётся текстом, без перевода глифов в контуры
+}
+
+# Методы рисования графиков (без сохранения) по ключу графика
+_DRAW_METHODS = {
+    '1_open_time_histogram': '_draw_open_time_histogram',
+    '2_status_times': '_draw_status_times',
+    '3_daily_tasks': '_draw_daily_tasks',
+    '4_top_users': '_draw_top_users',
+    '5_logged_time_histogram': '_draw_logged_time_histogram',
+    '6_priority_distribution': '_draw_priority_distribution',
+}
+# Высота фигуры относительно figure_size['height'] (остальные графики - 1)
+_HEIGHT_SCALE = {'3_daily_tasks': 1.5}
+
+# Векторные форматы: каждый элемент графика записывается в файл отдельным контуром
+_VECTOR_FORMATS = ('svg', 'pdf', 'eps')
+# Больше элементов - график сохраняется в растре: запись контуров обходится дороже PNG
+_VECTOR_MAX_ARTISTS = 1000
+
+# Столбцы с небольшим числом различных значений: в категориальном виде
+# сравнения и подсчёты идут по целочисленным кодам, а не по строкам
+_CATEGORY_COLUMNS = ('status', 'priority')
+
+
+def _write_file(filepath: str, buf: io.BytesIO):
+    """
+    Записывает готовое содержимое файла из памяти.
+    
+    Файл открывается через os.open без буферизованной обёртки Python,
+    содержимое уходит одним os.write (повтор - только при частичной записи).
+    
+    Args:
+        filepath: Путь к файлу
+        buf: Закодированное изображение
+    """
+    data = buf.getbuffer()
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+        data.release()
+
+
+def _hist_trace(data: np.ndarray, n_bins: int, name: str, **trace) -> Dict[str, Any]:
+    """
+    Столбцы гистограммы для Plotly: интервалы считаются здесь, клиенту уходят только итоги.
+    
+    Args:
+        data: Значения без NaN
+        n_bins: Количество интервалов
+        name: Подпись в легенде
+        **trace: Дополнительные поля трассы (xaxis, yaxis, marker, ...)
+        
+    Returns:
+        Dict: Трасса Plotly типа 'bar'
+    """
+    counts, edges = _hist_counts(data, n_bins)
+    return {'type': 'bar', 'name': name,
+            'x': ((edges[:-1] + edges[1:]) / 2).tolist(), 'y': np.asarray(counts).tolist(),
+            'width': np.diff(edges).tolist(), **trace}
+
+
+def _count_artists(fig) -> int:
+    """Число элементов на осях фигуры (коллекция считается по числу её контуров)."""
+    n_artists = 0
+    for ax in fig.axes:
+        for artist in ax.get_children():
+            n_artists += len(artist.get_paths()) if isinstance(artist, Collection) else 1
+    return n_artists
+
+
+def _with_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Возвращает DataFrame с категориальными столбцами _CATEGORY_COLUMNS.
+    
+    Исходный DataFrame не изменяется; если приводить нечего, он же и возвращается.
+    """
+    casts = {
+        col: 'category' for col in _CATEGORY_COLUMNS
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    # copy=False: копируются только приводимые столбцы, остальные остаются общими с исходным
+    return df.astype(casts, copy=False) if casts else df
+
+
+def _prepare_frames(df_all: pd.DataFrame, df_closed: pd.DataFrame):
+    """
+    Общая подготовка входных данных для всех графиков - один раз на построение.
+    
+    Если оба аргумента - один и тот же DataFrame (нет отдельного набора всех
+    задач), он приводится один раз и возвращается в обеих позициях.
+    
+    Args:
+        df_all: DataFrame со всеми задачами
+        df_closed: DataFrame с закрытыми задачами
+        
+    Returns:
+        tuple: (df_all, df_closed, время выполнения массивом float32 или None) -
+               NaN в массиве остаются, чтобы позиции совпадали со строками df_closed
+    """
+    same = df_closed is df_all
+    df_all = _with_categories(df_all)
+    df_closed = df_all if same else _with_categories(df_closed)
+    open_time_hours = (
+        _hours_array(df_closed['open_time_hours'])
+        if not df_closed.empty and 'open_time_hours' in df_closed.columns else None
+    )
+    return df_all, df_closed, open_time_hours
+
+
+def _update_fingerprint(h, obj):
+    """
+    Добавляет содержимое входных данных графика в хэш.
+    
+    Таблицы и массивы хэшируются векторно (pd.util.hash_pandas_object),
+    без обхода строк в Python.
+    
+    Args:
+        h: Объект hashlib (blake2b)
+        obj: DataFrame, Series, массив, список, словарь, кортеж или скаляр
+    """
+    if isinstance(obj, pd.DataFrame):
+        h.update(repr((list(obj.columns), list(map(str, obj.dtypes)))).encode('utf-8'))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, (pd.Series, pd.Index, np.ndarray, list)):
+        values = pd.Series(obj)
+        values.index = pd.RangeIndex(len(values))  # Значение имеет только содержимое
+        h.update(str(values.dtype).encode('utf-8'))
+        h.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=str):
+            h.update(repr(key).encode('utf-8'))
+            _update_fingerprint(h, obj[key])
+    elif isinstance(obj, tuple):
+        for item in obj:
+            _update_fingerprint(h, item)
+    else:
+        h.update(repr(obj).encode('utf-8'))
+
 
 class PlotBuilder:
     """Класс для создания 6 графиков согласно заданию."""
     
+    # Стиль matplotlib глобальный: настраивается один раз для всех экземпляров
+    _style_initialized = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Инициализация построителя графиков.
@@ -23,6 +402,10 @@ class PlotBuilder:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Уже построенные графики: ключ графика -> (хэш входных данных, путь к файлу).
+        # Файл графика один на ключ и перезаписывается при каждой отрисовке,
+        # поэтому для ключа хранится только хэш данных последнего построения
+        self._plot_cache: Dict[str, tuple] = {}
         
         # Настройки визуализации
         viz_config = config.get("visualization", {})
@@ -30,20 +413,79 @@ class PlotBuilder:
         self.figure_size = viz_config.get("figure_size", {"width": 12, "height": 8})
         self.dpi = viz_config.get("dpi", 150)
         self.save_format = viz_config.get("save_format", "png")
+        # Сжатие PNG (zlib 0-9): отчётам важнее скорость записи, чем размер файла
+        self.png_compress_level = viz_config.get("png_compress_level", 1)
+        # Формат отдельных графиков (ключ - имя файла без расширения, например "4_top_users": "svg")
+        self.plot_formats = dict(viz_config.get("plot_formats", {}))
+        # Быстрый предпросмотр: WebP с потерями кодируется быстрее PNG и даёт меньшие файлы
+        if viz_config.get("fast_preview", False):
+            self.save_format = "webp"
+            self.plot_formats = {}  # Предпросмотр целиком в WebP
+        # Как строить графики: "thread" (потоки), "process" (процессы) или "serial" (по очереди).
+        # Процессы полностью обходят GIL, но копируют входные данные в каждый процесс
+        self.plot_executor = viz_config.get("plot_executor", "thread")
+        # Результат create_all_plots: "png" - файлы изображений (save_format),
+        # "json" - один файл с данными для отрисовки в браузере через Plotly.js
+        self.render_mode = viz_config.get("render_mode", "png")
+        # При последовательном построении все графики рисуются на одном Figure:
+        # холст Agg создаётся один раз, между графиками фигура только очищается.
+        # Figure не потокобезопасен - графики на нём строятся под блокировкой
+        self._fig: Optional[Figure] = None
+        self._fig_lock: Optional[threading.Lock] = None
+        if self.plot_executor == "serial":
+            self._fig = Figure(dpi=self.dpi)
+            FigureCanvasAgg(self._fig)
+            self._fig_lock = threading.Lock()
         
         # Создаёт папку для отчётов
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
         
-        # Настройка стиля графиков
-        plt.style.use('seaborn-v0_8-darkgrid')
-        sns.set_palette("husl")
-        plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial', 'Helvetica']
-        plt.rcParams['axes.unicode_minus'] = False
+        # Настройка стиля графиков (только при создании первого экземпляра)
+        self._init_style()
+    
+    @classmethod
+    def _init_style(cls):
+        """
+        Настройка стиля графиков один раз на процесс.
+        
+        Вызывается из __init__ и при запуске каждого процесса пула,
+        где стиль из основного процесса недоступен.
+        """
+        if not cls._style_initialized:
+            plt.rcParams.update(_STYLE)
+            # Палитра husl (как sns.set_palette("husl")) - цикл цветов линий и столбцов
+            plt.rcParams['axes.prop_cycle'] = plt.cycler(color=sns.color_palette("husl"))
+            # Длинные линии (графики по дням) растеризуются частями по 10000 точек
+            plt.rcParams['agg.path.chunksize'] = 10000
+            cls._warm_up_renderer()
+            PlotBuilder._style_initialized = True
+    
+    @staticmethod
+    def _warm_up_renderer():
+        """
+        Пробная отрисовка маленькой фигуры.
+        
+        Первая отрисовка загружает кэш шрифтов, Agg, FreeType и кодировщик PNG.
+        Здесь это происходит один раз заранее, а не внутри первого графика
+        и не одновременно в потоках графиков.
+        """
+        # Поиск файлов шрифтов (обычный и жирный) запоминается font_manager
+        families = plt.rcParams['font.sans-serif']
+        font_manager.findfont(font_manager.FontProperties(family=families))
+        font_manager.findfont(font_manager.FontProperties(family=families, weight='bold'))
+        
+        fig = Figure(figsize=(1, 1))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        ax.set_title('Warm-up', fontweight='bold')  # Обычный и жирный шрифт
+        ax.text(0.5, 0.5, 'Задачи')  # Кириллические глифы
+        fig.savefig(io.BytesIO(), format='png')  # Отрисовка и запись PNG в память
     
     # ========== ОСНОВНОЙ МЕТОД: СОЗДАНИЕ ВСЕХ 6 ГРАФИКОВ ==========
     
-    def create_all_plots(self, plot_data: Dict[str, Any], df_all: pd.DataFrame, df_closed: pd.DataFrame) -> Dict[str, str]:
+    def create_all_plots(self, plot_data: Dict[str, Any], df_all: pd.DataFrame, df_closed: pd.DataFrame,
+                         return_arrays: bool = False) -> Dict[str, Any]:
         """
         Создаёт все 6 графиков согласно заданию.
         
@@ -51,46 +493,414 @@ class PlotBuilder:
             plot_data: Данные для построения графиков (из DataProcessor)
             df_all: DataFrame с ВСЕМИ задачами (для графиков 3, 4, 6)
             df_closed: DataFrame только с ЗАКРЫТЫМИ задачами (для графиков 1, 2, 5)
+            return_arrays: Вернуть пиксели графиков (массивы uint8 высота x ширина x RGBA)
+                           вместо сохранения файлов - без кодирования PNG и записи на диск
             
         Returns:
-            Dict: Словарь с путями к сохранённым графикам в правильной последовательности
+            Dict: Словарь с путями к сохранённым графикам (или массивами пикселей)
+                  в правильной последовательности
         """
+        if self.render_mode == "json" and not return_arrays:
+            payload = self.create_all_plots_json(plot_data, df_all, df_closed)
+            filepath = os.path.join(self.output_dir, "plots.json")
+            _write_file(filepath, io.BytesIO(json.dumps(payload, ensure_ascii=False).encode('utf-8')))
+            self.logger.info(f"Данные {len(payload)} графиков для Plotly сохранены: {filepath}")
+            return {'plots_json': filepath}
+        
         self.logger.info("Создание 6 графиков аналитики...")
-        plot_paths = {}
+        
+        # Статус и приоритет - в категории, время выполнения - массивом float32 для графиков 2 и 5
+        # (один раз для всех графиков)
+        df_all, df_closed, open_time_hours = _prepare_frames(df_all, df_closed)
+        
+        # Проверки входных данных - один раз для всех графиков
+        closed_ready = not df_closed.empty  # Есть закрытые задачи (графики 1, 2, 5)
+        all_ready = not df_all.empty        # Есть все задачи (графики 3, 4, 6)
+        
+        tasks = []  # (ключ графика, метод, аргументы) в порядке нумерации
         
         # ГРАФИК 1: Гистограмма времени в открытом состоянии (закрытые задачи)
-        if 'open_time_data' in plot_data and not df_closed.empty:
-            path = self.plot_open_time_histogram(plot_data['open_time_data'])
-            plot_paths['1_open_time_histogram'] = path
+        if closed_ready and 'open_time_data' in plot_data:
+            tasks.append(('1_open_time_histogram', self.plot_open_time_histogram, (plot_data['open_time_data'],)))
         
         # ГРАФИК 2: Распределение времени по состояниям (закрытые задачи)
-        if not df_closed.empty:
-            path = self.plot_status_times(df_closed)
-            plot_paths['2_status_times'] = path
+        if closed_ready:
+            tasks.append(('2_status_times', self.plot_status_times, (df_closed, open_time_hours)))
         
         # ГРАФИК 3: Количество задач по дням с накопительным итогом (все задачи)
-        if 'daily_tasks_data' in plot_data and not df_all.empty:
-            path = self.plot_daily_tasks(plot_data['daily_tasks_data'])
-            plot_paths['3_daily_tasks'] = path
+        if all_ready and 'daily_tasks_data' in plot_data:
+            tasks.append(('3_daily_tasks', self.plot_daily_tasks, (plot_data['daily_tasks_data'],)))
         
         # ГРАФИК 4: Топ-30 пользователей (все задачи)
-        if not df_all.empty:
-            path = self.plot_top_users(df_all)
-            plot_paths['4_top_users'] = path
+        if all_ready:
+            tasks.append(('4_top_users', self.plot_top_users, (df_all,)))
         
         # ГРАФИК 5: Гистограмма залогированного времени (закрытые задачи)
-        if not df_closed.empty:
-            path = self.plot_logged_time_histogram(df_closed)
-            plot_paths['5_logged_time_histogram'] = path
+        if closed_ready:
+            tasks.append(('5_logged_time_histogram', self.plot_logged_time_histogram, (df_closed, open_time_hours)))
         
         # ГРАФИК 6: Распределение по приоритетам (все задачи)
-        if not df_all.empty:
-            path = self.plot_priority_distribution(df_all)
-            plot_paths['6_priority_distribution'] = path
+        if all_ready:
+            tasks.append(('6_priority_distribution', self.plot_priority_distribution, (df_all,)))
+        
+        if return_arrays:
+            # Пиксели берутся прямо из буфера холста Agg; каждый график на своём Figure
+            with ThreadPoolExecutor(max_workers=max(1, len(tasks))) as executor:
+                futures = [(key, executor.submit(self._render_rgba, key, args)) for key, _, args in tasks]
+                plot_arrays = {key: future.result() for key, future in futures}
+            self.logger.info(f"Отрисовано {len(plot_arrays)} графиков из 6 требуемых (в память)")
+            return plot_arrays
+        
+        # Графики независимы: каждый строит свой Figure (без общего состояния pyplot),
+        # отрисовка Agg и сжатие PNG отпускают GIL и идут параллельно
+        # Графики с теми же данными и настройками, что уже построены, не перерисовываются
+        plot_paths = {}
+        pending = []  # Графики, которых нет в кэше
+        for key, method, args in tasks:
+            fingerprint = self._fingerprint(args)
+            cached = self._plot_cache.get(key)
+            if cached is not None and cached[0] == fingerprint and os.path.exists(cached[1]):
+                plot_paths[key] = cached[1]
+            else:
+                plot_paths[key] = None  # Место в порядке нумерации, путь - после построения
+                pending.append((key, fingerprint, method, args))
+        
+        if pending and self._fig is not None:
+            with self._fig_lock:
+                for key, fingerprint, method, args in pending:
+                    plot_paths[key] = method(*args)
+                    self._plot_cache[key] = (fingerprint, plot_paths[key])
+        elif pending:
+            if self.plot_executor == "process":
+                # Процессы не ограничены GIL и на Python-части графиков;
+                # стиль настраивается в каждом процессе при запуске
+                executor = ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1),
+                                               initializer=PlotBuilder._init_style)
+            else:
+                executor = ThreadPoolExecutor(max_workers=len(pending))
+            with executor:
+                if self.plot_executor == "process":
+                    # В процесс передаются только настройки графиков и данные,
+                    # а не весь PlotBuilder (config, логгер, кэш)
+                    settings = self._worker_settings()
+                    futures = [(key, fingerprint,
+                                executor.submit(_plot_in_worker, settings, method.__name__, args))
+                               for key, fingerprint, method, args in pending]
+                else:
+                    futures = [(key, fingerprint, executor.submit(method, *args))
+                               for key, fingerprint, method, args in pending]
+                for key, fingerprint, future in futures:  # Результаты в порядке нумерации графиков
+                    plot_paths[key] = future.result()
+                    self._plot_cache[key] = (fingerprint, plot_paths[key])
         
+        if len(pending) < len(tasks):
+            self.logger.info(f"Из кэша взято {len(tasks) - len(pending)} графиков")
         self.logger.info(f"Создано {len(plot_paths)} графиков из 6 требуемых")
         return plot_paths
     
+    def create_all_plots_batched(self, plot_data: Dict[str, Any], df_all: pd.DataFrame,
+                                 df_closed: pd.DataFrame, slice_plots: bool = False) -> Dict[str, str]:
+        """
+        Рисует все 6 графиков в одной фигуре-дашборде (сетка 2x3) и отрисовывает её один раз.
+        
+        Подготовка фигуры, холста и запись файла выполняются один раз вместо шести.
+        
+        Args:
+            plot_data: Данные для построения графиков (из DataProcessor)
+            df_all: DataFrame с ВСЕМИ задачами (для графиков 3, 4, 6)
+            df_closed: DataFrame только с ЗАКРЫТЫМИ задачами (для графиков 1, 2, 5)
+            slice_plots: Дополнительно нарезать отрисованный дашборд на 6 отдельных файлов
+            
+        Returns:
+            Dict: Путь к дашборду ('dashboard') и, при slice_plots, пути к вырезанным графикам
+        """
+        self.logger.info("Создание дашборда из 6 графиков...")
+        
+        df_all, df_closed, open_time_hours = _prepare_frames(df_all, df_closed)
+        closed_ready = not df_closed.empty
+        all_ready = not df_all.empty
+        
+        # (ключ графика, метод рисования, аргументы) - ячейки сетки в порядке нумерации
+        cells = [
+            ('1_open_time_histogram', self._draw_open_time_histogram, (plot_data.get('open_time_data'),),
+             closed_ready and 'open_time_data' in plot_data),
+            ('2_status_times', self._draw_status_times, (df_closed, open_time_hours), closed_ready),
+            ('3_daily_tasks', self._draw_daily_tasks, (plot_data.get('daily_tasks_data'),),
+             all_ready and 'daily_tasks_data' in plot_data),
+            ('4_top_users', self._draw_top_users, (df_all,), all_ready),
+            ('5_logged_time_histogram', self._draw_logged_time_histogram, (df_closed, open_time_hours),
+             closed_ready),
+            ('6_priority_distribution', self._draw_priority_distribution, (df_all,), all_ready),
+        ]
+        
+        fig = Figure(figsize=(self.figure_size['width'] * 3, self.figure_size['height'] * 2), dpi=self.dpi)
+        subfigs = fig.subfigures(2, 3).flatten()  # Каждая ячейка - своя подфигура со своими полями
+        drawn = []  # (ключ графика, подфигура)
+        for (key, draw, args, ready), subfig in zip(cells, subfigs):
+            if ready:
+                draw(subfig, *args)
+                drawn.append((key, subfig))
+        
+        if not slice_plots:
+            plot_paths = {'dashboard': self._save_figure(fig, "dashboard")}
+        else:
+            # Одна отрисовка: и дашборд, и вырезки берутся из одного буфера холста
+            canvas = FigureCanvasAgg(fig)
+            canvas.draw()
+            image = Image.fromarray(np.asarray(canvas.buffer_rgba()))
+            if self.save_format in ('jpg', 'jpeg'):
+                image = image.convert('RGB')  # JPEG без альфа-канала
+            pil_kwargs = {**self._pil_kwargs(), 'dpi': (self.dpi, self.dpi)}
+            
+            plot_paths = {'dashboard': os.path.join(self.output_dir, f"dashboard.{self.save_format}")}
+            _write_file(plot_paths['dashboard'], self._encode_image(image, pil_kwargs))
+            height = image.height
+            for key, subfig in drawn:
+                # bbox подфигуры в пикселях от нижнего края, у изображения - от верхнего
+                x0, y0, x1, y1 = subfig.bbox.extents
+                box = (int(round(x0)), int(round(height - y1)), int(round(x1)), int(round(height - y0)))
+                plot_paths[key] = os.path.join(self.output_dir, f"{key}.{self.save_format}")
+                _write_file(plot_paths[key], self._encode_image(image.crop(box), pil_kwargs))
+                self._plot_cache.pop(key, None)  # Файл графика перезаписан вырезкой
+        
+        self.logger.info(f"Дашборд создан: {plot_paths['dashboard']} ({len(drawn)} графиков из 6)")
+        return plot_paths
+    
+    def create_all_plots_json(self, plot_data: Dict[str, Any], df_all: pd.DataFrame,
+                              df_closed: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Готовит те же 6 графиков как данные для Plotly.js, без отрисовки matplotlib.
+        
+        Каждый график - словарь {'data': [трассы], 'layout': {...}}, который клиент
+        рисует вызовом Plotly.newPlot(div, figure.data, figure.layout).
+        
+        Args:
+            plot_data: Данные для построения графиков (из DataProcessor)
+            df_all: DataFrame с ВСЕМИ задачами (для графиков 3, 4, 6)
+            df_closed: DataFrame только с ЗАКРЫТЫМИ задачами (для графиков 1, 2, 5)
+            
+        Returns:
+            Dict: Ключ графика (как имя файла в режиме "png") -> фигура Plotly
+        """
+        df_all, df_closed, open_time_hours = _prepare_frames(df_all, df_closed)
+        closed_ready = not df_closed.empty
+        all_ready = not df_all.empty
+        
+        figures = {}
+        
+        # ГРАФИК 1: Гистограмма времени в открытом состоянии
+        if closed_ready and 'open_time_data' in plot_data:
+            data, data_filtered = _prep_hist(plot_data['open_time_data'])
+            traces = [_hist_trace(data_filtered, min(30, len(data_filtered)),
+                                  f'Задачи (всего: {len(data)})')] if len(data) > 0 else []
+            figures['1_open_time_histogram'] = {'data': traces, 'layout': {
+                'title': 'ГРАФИК 1: Время в открытом состоянии (закрытые задачи)',
+                'xaxis': {'title': 'Время в открытом состоянии (часы)'},
+                'yaxis': {'title': 'Количество задач'}}}
+        
+        # ГРАФИК 2: Время по состояниям - сетка подграфиков, по одному на статус
+        if closed_ready:
+            traces = []
+            layout = {'title': 'ГРАФИК 2: Распределение времени по состояниям задачи (закрытые задачи)',
+                      'showlegend': False}
+            if 'status' in df_closed.columns and open_time_hours is not None:
+                status_groups = df_closed.groupby('status', sort=False, observed=True).indices
+                for idx, (status, positions) in enumerate(status_groups.items(), start=1):
+                    time_data = open_time_hours[positions]
+                    time_data = time_data[~np.isnan(time_data)]
+                    if len(time_data) > 0:
+                        axis = '' if idx == 1 else str(idx)  # Оси Plotly: x, x2, x3, ...
+                        traces.append(_hist_trace(time_data, min(20, len(time_data)), str(status),
+                                                  xaxis=f'x{axis}', yaxis=f'y{axis}'))
+                n_cols = min(3, max(1, len(status_groups)))
+                layout['grid'] = {'rows': (len(status_groups) + n_cols - 1) // n_cols,
+                                  'columns': n_cols, 'pattern': 'independent'}
+            figures['2_status_times'] = {'data': traces, 'layout': layout}
+        
+        # ГРАФИК 3: Задачи по дням (столбцы) и накопительный итог (линии под ними)
+        if all_ready and 'daily_tasks_data' in plot_data:
+            daily_data = plot_data['daily_tasks_data']
+            dates = np.asarray(daily_data.get('dates', []))
+            days = pd.DatetimeIndex(dates).strftime('%Y-%m-%d').tolist() if len(dates) > 0 else []
+            created = np.asarray(daily_data.get('created', []), dtype=np.int64)
+            resolved = np.asarray(daily_data.get('resolved', []), dtype=np.int64)
+            has_resolved = len(resolved) > 0 and len(resolved) == len(dates)
+            created_cum = np.asarray(daily_data.get('created_cumulative', np.cumsum(created)))
+            
+            traces = [{'type': 'bar', 'name': 'Создано', 'x': days, 'y': created.tolist()}]
+            if has_resolved:
+                traces.append({'type': 'bar', 'name': 'Закрыто', 'x': days, 'y': resolved.tolist()})
+            traces.append({'type': 'scatter', 'mode': 'lines+markers', 'name': 'Создано (накоп.)',
+                           'x': days, 'y': created_cum.tolist(), 'xaxis': 'x2', 'yaxis': 'y2'})
+            if 'resolved_cumulative' in daily_data and len(daily_data['resolved_cumulative']) == len(dates):
+                resolved_cum = np.asarray(daily_data['resolved_cumulative'])
+            else:
+                resolved_cum = np.cumsum(resolved) if has_resolved else None
+            if resolved_cum is not None:
+                traces.append({'type': 'scatter', 'mode': 'lines+markers', 'name': 'Закрыто (накоп.)',
+                               'x': days, 'y': resolved_cum.tolist(), 'xaxis': 'x2', 'yaxis': 'y2'})
+            figures['3_daily_tasks'] = {'data': traces, 'layout': {
+                'title': 'ГРАФИК 3: Динамика задач по дням',
+                'barmode': 'group',
+                'grid': {'rows': 2, 'columns': 1, 'pattern': 'independent'},
+                'yaxis': {'title': 'Количество задач в день'},
+                'yaxis2': {'title': 'Накопительное количество задач'}}}
+        
+        # ГРАФИК 4: Топ-30 пользователей - горизонтальные столбцы с накоплением
+        if all_ready:
+            empty_counts = pd.Series(dtype=np.int64)
+            rep = df_all['reporter'].dropna().value_counts() if 'reporter' in df_all.columns else empty_counts
+            asg = df_all['assignee'].dropna().value_counts() if 'assignee' in df_all.columns else empty_counts
+            top_users = rep.add(asg, fill_value=0).astype(np.int64).nlargest(30)
+            users = top_users.index.to_list()
+            figures['4_top_users'] = {'data': [
+                {'type': 'bar', 'orientation': 'h', 'name': 'Репортер', 'y': users,
+                 'x': rep.reindex(users, fill_value=0).to_numpy().tolist()},
+                {'type': 'bar', 'orientation': 'h', 'name': 'Исполнитель', 'y': users,
+                 'x': asg.reindex(users, fill_value=0).to_numpy().tolist()},
+            ], 'layout': {
+                'title': 'ГРАФИК 4: Топ-30 пользователей по задачам',
+                'barmode': 'stack',
+                'xaxis': {'title': 'Общее количество задач'},
+                'yaxis': {'autorange': 'reversed'}}}  # Первый в топе - сверху, как в PNG
+        
+        # ГРАФИК 5: Гистограмма залогированного времени
+        if closed_ready:
+            traces = []
+            if open_time_hours is not None:
+                data, data_filtered = _prep_hist(open_time_hours)
+                if len(data) > 0:
+                    traces.append(_hist_trace(data_filtered, min(25, len(data_filtered)),
+                                              f'Приближённое время (всего: {len(data)} задач)'))
+            figures['5_logged_time_histogram'] = {'data': traces, 'layout': {
+                'title': 'ГРАФИК 5: Распределение времени выполнения (закрытые задачи, приближённые данные)',
+                'xaxis': {'title': 'Приближённое залогированное время (часы)'},
+                'yaxis': {'title': 'Количество задач'}}}
+        
+        # ГРАФИК 6: Распределение по приоритетам
+        if all_ready:
+            priority_counts = (df_all['priority'].dropna().value_counts()
+                               if 'priority' in df_all.columns else pd.Series(dtype=np.int64))
+            figures['6_priority_distribution'] = {'data': [
+                {'type': 'bar', 'x': [str(label) for label in priority_counts.index],
+                 'y': priority_counts.to_numpy().tolist(), 'text': priority_counts.to_numpy().tolist()},
+            ], 'layout': {
+                'title': 'ГРАФИК 6: Распределение задач по степени серьезности (все задачи)',
+                'xaxis': {'title': 'Степень серьезности (приоритет)'},
+                'yaxis': {'title': 'Количество задач'}}}
+        
+        return figures
+    
+    def _render_rgba(self, key: str, args: tuple) -> np.ndarray:
+        """
+        Отрисовывает график и возвращает его пиксели без кодирования в файл.
+        
+        Args:
+            key: Ключ графика (имя файла, например "4_top_users")
+            args: Аргументы метода рисования
+            
+        Returns:
+            np.ndarray: Массив uint8 формы (высота, ширина, 4) поверх буфера холста, без копии
+        """
+        width, height = self.figure_size['width'], self.figure_size['height']
+        fig = Figure(figsize=(width, height * _HEIGHT_SCALE.get(key, 1)), dpi=self.dpi)
+        n_rows = getattr(self, _DRAW_METHODS[key])(fig, *args)
+        if key == '2_status_times':  # Высота зависит от числа строк подграфиков
+            fig.set_size_inches(width, height * max(1, n_rows * 0.8))
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        # Массив держит ссылку на буфер отрисовщика, поэтому он остаётся действительным
+        return np.asarray(canvas.buffer_rgba())
+    
+    def _worker_settings(self) -> Dict[str, Any]:
+        """Настройки визуализации, влияющие на файлы графиков, для PlotBuilder в процессе пула."""
+        return {"visualization": {
+            "output_dir": self.output_dir,
+            "figure_size": self.figure_size,
+            "dpi": self.dpi,
+            "save_format": self.save_format,
+            "png_compress_level": self.png_compress_level,
+            "plot_formats": self.plot_formats,
+        }}
+    
+    def _fingerprint(self, args: tuple) -> bytes:
+        """Хэш входных данных графика вместе с настройками, влияющими на файл."""
+        h = hashlib.blake2b(digest_size=16)
+        _update_fingerprint(h, (self.output_dir, self.figure_size, self.dpi,
+                                self.save_format, self.plot_formats, self.png_compress_level))
+        _update_fingerprint(h, args)
+        return h.digest()
+    
+    def clear_cache(self):
+        """Сбрасывает кэш построенных графиков (следующий вызов перерисует все)."""
+        self._plot_cache.clear()
+    
+    def _new_figure(self, width: float, height: float) -> Figure:
+        """
+        Фигура для очередного графика: общий очищенный Figure в режиме "serial", иначе новый.
+        
+        Args:
+            width: Ширина в дюймах
+            height: Высота в дюймах
+            
+        Returns:
+            Figure: Пустая фигура нужного размера
+        """
+        if self._fig is None:
+            return Figure(figsize=(width, height))
+        self._fig.clear()
+        self._fig.set_size_inches(width, height)
+        return self._fig
+    
+    def _save_figure(self, fig: Figure, name: str) -> str:
+        """
+        Сохраняет фигуру в папку отчётов.
+        
+        Поля задаются при создании осей (gridspec_kw=_margins(...)), чтобы
+        один и тот же код рисования работал и в ячейке дашборда.
+        
+        Args:
+            fig: Готовая фигура
+            name: Имя файла без расширения
+            
+        Returns:
+            str: Путь к сохранённому файлу
+        """
+        save_format = self.plot_formats.get(name, self.save_format)
+        if save_format in _VECTOR_FORMATS and _count_artists(fig) > _VECTOR_MAX_ARTISTS:
+            # Много элементов - вектор медленнее и больше растра
+            save_format = self.save_format if self.save_format not in _VECTOR_FORMATS else 'png'
+        filepath = os.path.join(self.output_dir, f"{name}.{save_format}")
+        save_kwargs = {}
+        pil_kwargs = self._pil_kwargs(save_format)
+        if pil_kwargs:
+            save_kwargs['pil_kwargs'] = pil_kwargs
+        # Кодирование в память, затем запись файла одним системным вызовом
+        buf = io.BytesIO()
+        fig.savefig(buf, format=save_format, dpi=self.dpi, **save_kwargs)
+        _write_file(filepath, buf)
+        # Файл перезаписан - прежняя запись кэша для него больше не верна
+        self._plot_cache.pop(name, None)
+        return filepath
+    
+    def _encode_image(self, image: Image.Image, pil_kwargs: Dict[str, Any]) -> io.BytesIO:
+        """Кодирует изображение Pillow в память в формате отчётов."""
+        buf = io.BytesIO()
+        pil_format = 'JPEG' if self.save_format in ('jpg', 'jpeg') else self.save_format.upper()
+        image.save(buf, format=pil_format, **pil_kwargs)
+        return buf
+    
+    def _pil_kwargs(self, save_format: Optional[str] = None) -> Dict[str, Any]:
+        """Параметры записи растра через Pillow для формата (по умолчанию - общего формата отчётов)."""
+        save_format = save_format or self.save_format
+        if save_format == 'png':
+            # PNG пишется через Pillow; уровень 1 вместо 6 в разы быстрее при чуть большем файле,
+            # без дополнительного прохода optimize
+            return {'compress_level': self.png_compress_level, 'optimize': False}
+        if save_format == 'webp':
+            return {'quality': 80}  # Качество предпросмотра
+        return {}
+    
     # ========== ГРАФИК 1: Время в открытом состоянии ==========
     
     def plot_open_time_histogram(self, open_time_data: pd.Series) -> str:
@@ -104,24 +914,26 @@ class PlotBuilder:
         Returns:
             str: Путь к сохранённому файлу
         """
-        fig, ax = plt.subplots(figsize=(self.figure_size['width'], self.figure_size['height']))
+        fig = self._new_figure(self.figure_size['width'], self.figure_size['height'])
+        self._draw_open_time_histogram(fig, open_time_data)
+        filepath = self._save_figure(fig, "1_open_time_histogram")
+        
+        self.logger.info(f"График 1 создан: {filepath}")
+        return filepath
+    
+    def _draw_open_time_histogram(self, fig, open_time_data: pd.Series):
+        """Рисует график 1 на фигуре (Figure или SubFigure дашборда)."""
+        ax = fig.subplots(gridspec_kw=_margins())
         
         # Фильтруем данные (исключаем выбросы)
-        data = open_time_data.dropna()
+        data, data_filtered = _prep_hist(open_time_data)
         if len(data) > 0:
-            q95 = data.quantile(0.95)
-            data_filtered = data[data <= q95]
-            
-            # Если после фильтрации данных мало, используем все
-            if len(data_filtered) < 10:
-                data_filtered = data
-            
             # Строим гистограмму
             n_bins = min(30, len(data_filtered))
-            counts, bins, patches = ax.hist(
-                data_filtered, 
-                bins=n_bins,
-                edgecolor='black',
+            counts, bins, patches = _draw_hist(
+                ax,
+                data_filtered,
+                n_bins,
                 alpha=0.7,
                 color='skyblue',
                 label=f'Задачи (всего: {len(open_time_data)})'
@@ -134,12 +946,14 @@ class PlotBuilder:
                     fontsize=14, fontweight='bold')
         
         # Статистика
-        if len(open_time_data) > 0:
+        if len(data) > 0:
+            # Несмещённое отклонение (ddof=1), как у pd.Series.std
+            std = data.std(ddof=1) if len(data) > 1 else float('nan')
             stats_text = (
                 f'Всего задач: {len(open_time_data)}\n'
-                f'Среднее: {open_time_data.mean():.1f} ч\n'
-                f'Медиана: {open_time_data.median():.1f} ч\n'
-                f'Станд. отклонение: {open_time_data.std():.1f} ч'
+                f'Среднее: {data.mean():.1f} ч\n'
+                f'Медиана: {np.median(data):.1f} ч\n'
+                f'Станд. отклонение: {std:.1f} ч'
             )
             ax.text(
                 0.80, 0.75, stats_text,
@@ -149,21 +963,13 @@ class PlotBuilder:
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8)
             )
         
-        ax.legend(loc='upper left')
+        ax.legend(loc=2)  # 2 = 'upper left'
         ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        filename = f"1_open_time_histogram.{self.save_format}"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        self.logger.info(f"График 1 создан: {filepath}")
-        return filepath
     
     # ========== ГРАФИК 2: Распределение времени по состояниям ==========
     
-    def plot_status_times(self, df_closed: pd.DataFrame) -> str:
+    def plot_status_times(self, df_closed: pd.DataFrame,
+                          open_time_hours: Optional[np.ndarray] = None) -> str:
         """
         ГРАФИК 2: Диаграммы распределения времени по состояниям задачи.
         Задание: "Для каждого состояния своя диаграмма", "только закрытые задачи"
@@ -173,24 +979,40 @@ class PlotBuilder:
         
         Args:
             df_closed: DataFrame с закрытыми задачами
+            open_time_hours: Столбец open_time_hours массивом float32 (вычисляется, если не передан)
             
         Returns:
             str: Путь к сохранённому файлу
         """
-        # Создаём подграфики
-        n_statuses = 1  # По умолчанию 1 статус
+        fig = self._new_figure(self.figure_size['width'], self.figure_size['height'])
+        n_rows = self._draw_status_times(fig, df_closed, open_time_hours)
+        # Высота зависит от числа строк подграфиков, известного только после группировки
+        fig.set_size_inches(self.figure_size['width'],
+                            self.figure_size['height'] * max(1, n_rows * 0.8))
+        filepath = self._save_figure(fig, "2_status_times")
         
+        self.logger.info(f"График 2 создан: {filepath}")
+        return filepath
+    
+    def _draw_status_times(self, fig, df_closed: pd.DataFrame,
+                           open_time_hours: Optional[np.ndarray]) -> int:
+        """Рисует график 2 на фигуре и возвращает число строк подграфиков."""
+        if open_time_hours is None and 'open_time_hours' in df_closed.columns:
+            open_time_hours = _hours_array(df_closed['open_time_hours'])
+        
+        # Создаём подграфики
+        status_groups = {}  # Статус -> позиции его строк в df_closed
         if 'status' in df_closed.columns and len(df_closed) > 0:
-            unique_statuses = df_closed['status'].unique()
-            n_statuses = len(unique_statuses)
+            # Один проход группировки вместо сравнения всего столбца с каждым статусом
+            status_groups = df_closed.groupby('status', sort=False, observed=True).indices
+        n_statuses = max(1, len(status_groups))  # По умолчанию 1 статус
         
         # Ограничиваем количество подграфиков для читаемости
         n_cols = min(3, n_statuses)
         n_rows = (n_statuses + n_cols - 1) // n_cols
         
-        fig, axes = plt.subplots(n_rows, n_cols, 
-                                figsize=(self.figure_size['width'], 
-                                        self.figure_size['height'] * max(1, n_rows * 0.8)))
+        axes = fig.subplots(n_rows, n_cols,
+                            gridspec_kw=_margins(top=0.85, hspace=0.5, wspace=0.3))
         
         # Если только один график
         if n_statuses == 1:
@@ -198,23 +1020,25 @@ class PlotBuilder:
         
         axes = axes.flatten()
         
-        if 'status' in df_closed.columns and len(df_closed) > 0:
-            for idx, status in enumerate(unique_statuses):
+        if status_groups:
+            # Цвета всех статусов одним вызовом палитры (те же, что по idx / (n-1))
+            colors = plt.cm.tab20(np.linspace(0, 1, n_statuses))
+            for idx, (status, positions) in enumerate(status_groups.items()):
                 if idx < len(axes):
-                    # Фильтруем задачи по статусу
-                    status_df = df_closed[df_closed['status'] == status]
+                    n_tasks = len(positions)  # Задач с этим статусом
                     
-                    if len(status_df) > 0 and 'open_time_hours' in status_df.columns:
-                        time_data = status_df['open_time_hours'].dropna()
+                    if n_tasks > 0 and open_time_hours is not None:
+                        time_data = open_time_hours[positions]
+                        time_data = time_data[~np.isnan(time_data)]  # Убирает пустые значения
                         
                         if len(time_data) > 0:
                             # Гистограмма времени для этого статуса
-                            axes[idx].hist(
+                            _draw_hist(
+                                axes[idx],
                                 time_data,
-                                bins=min(20, len(time_data)),
-                                edgecolor='black',
+                                min(20, len(time_data)),
                                 alpha=0.7,
-                                color=plt.cm.tab20(idx / max(1, n_statuses-1))
+                                color=colors[idx]
                             )
                             
                             axes[idx].set_xlabel('Время (часы)')
@@ -225,7 +1049,7 @@ class PlotBuilder:
                             # Статистика
                             stats_text = (
                                 f'Среднее: {time_data.mean():.1f} ч\n'
-                                f'Медиана: {time_data.median():.1f} ч'
+                                f'Медиана: {np.median(time_data):.1f} ч'
                             )
                             axes[idx].text(
                                 0.85, 0.95, stats_text,
@@ -239,12 +1063,12 @@ class PlotBuilder:
                                          ha='center', va='center')
                             axes[idx].set_title(f'Статус: {status}')
                     else:
-                        axes[idx].text(0.5, 0.5, f'Задач: {len(status_df)}\nНет данных о времени',
+                        axes[idx].text(0.5, 0.5, f'Задач: {n_tasks}\nНет данных о времени',
                                      ha='center', va='center')
                         axes[idx].set_title(f'Статус: {status}')
             
             # Скрываем лишние оси
-            for idx in range(len(unique_statuses), len(axes)):
+            for idx in range(len(status_groups), len(axes)):
                 axes[idx].set_visible(False)
         else:
             # Если нет данных о статусах
@@ -255,16 +1079,8 @@ class PlotBuilder:
                 axes[idx].set_visible(False)
         
         fig.suptitle('ГРАФИК 2: Распределение времени по состояниям задачи\n(закрытые задачи)', 
-                    fontsize=16, fontweight='bold', y=1.02)
-        
-        plt.tight_layout()
-        filename = f"2_status_times.{self.save_format}"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        self.logger.info(f"График 2 создан: {filepath}")
-        return filepath
+                    fontsize=16, fontweight='bold', y=0.98)
+        return n_rows
     
     # ========== ГРАФИК 3: Количество задач по дням ==========
 
@@ -272,27 +1088,39 @@ class PlotBuilder:
         """
      ГРАФИК 3: Количество заведенных и закрытых задач в день с накопительным итогом.
       """
-        fig, axes = plt.subplots(2, 1, figsize=(self.figure_size['width'], self.figure_size['height'] * 1.5))
+        fig = self._new_figure(self.figure_size['width'],
+                               self.figure_size['height'] * _HEIGHT_SCALE['3_daily_tasks'])
+        self._draw_daily_tasks(fig, daily_data)
+        filepath = self._save_figure(fig, "3_daily_tasks")
+    
+        self.logger.info(f"График 3 создан: {filepath}")
+        return filepath
     
-        dates = daily_data.get('dates', [])
-        created = daily_data.get('created', [])
-        resolved = daily_data.get('resolved', [])
+    def _draw_daily_tasks(self, fig, daily_data: Dict):
+        """Рисует график 3 на фигуре (Figure или SubFigure дашборда)."""
+        axes = fig.subplots(2, 1, gridspec_kw=_margins(top=0.93, bottom=0.06, hspace=0.4))
+    
+        # Данные один раз приводятся к массивам: matplotlib не преобразует списки при каждом вызове
+        dates = np.asarray(daily_data.get('dates', []))
+        created = np.asarray(daily_data.get('created', []), dtype=np.int64)
+        resolved = np.asarray(daily_data.get('resolved', []), dtype=np.int64)
+        # Проверяет, что resolved не пустой и его длина совпадает с dates
+        has_resolved = len(resolved) > 0 and len(resolved) == len(dates)
+        x = np.arange(len(dates))  # Позиции столбцов по дням
     
-        #Проверяет, что resolved не пустой и его длина совпадает с dates
         if len(dates) == 0:
-         axes[0].text(0.5, 0.5, 'Нет данных по дням', ha='center', va='center')
-         axes[1].text(0.5, 0.5, 'Нет данных по дням', ha='center', va='center')
-        else:
+            axes[0].text(0.5, 0.5, 'Нет данных по дням', ha='center', va='center')
+            axes[1].text(0.5, 0.5, 'Нет данных по дням', ha='center', va='center')
+        
         # График 3a: Ежедневное количество задач
-         x = np.arange(len(dates))
         width = 0.35
         
         # Всегда строим график созданных задач
-        axes[0].bar(x - width/2, created, width, label='Создано', color='lightblue', alpha=0.8)
+        _add_bars(axes[0], x - width, created, width, label='Создано', color='lightblue', alpha=0.8)
         
         # Строим график закрытых задач, только если данные есть и длина совпадает
-        if len(resolved) > 0 and len(resolved) == len(dates):
-            axes[0].bar(x + width/2, resolved, width, label='Закрыто', color='lightcoral', alpha=0.8)
+        if has_resolved:
+            _add_bars(axes[0], x, resolved, width, label='Закрыто', color='lightcoral', alpha=0.8)
         else:
             # Если нет данных о закрытых, просто показываем информацию
             self.logger.warning(f"Нет данных о закрытых задачах для графика 3. "
@@ -310,30 +1138,27 @@ class PlotBuilder:
         if len(dates) > 10:
             step = max(1, len(dates) // 10)
             axes[0].set_xticks(x[::step])
-            date_labels = [str(d).split()[0] for d in dates]
-            axes[0].set_xticklabels(date_labels[::step], rotation=45, ha='right')
-        
-        # График 3b: Накопительный итог
-        created_cum = daily_data.get('created_cumulative', np.cumsum(created))
-        
-        # Для resolved_cumulative проверяем наличие данных
-        if 'resolved_cumulative' in daily_data:
-            resolved_cum = daily_data['resolved_cumulative']
-            if len(resolved_cum) == len(dates):
-                axes[1].plot(dates, resolved_cum, 'r-', linewidth=2, label='Закрыто (накоп.)', 
-                           marker='s', markersize=4)
-            else:
-                # Если длины не совпадают, вычисляем кумулятивную сумму из resolved
-                if len(resolved) == len(dates):
-                    resolved_cum = np.cumsum(resolved)
-                    axes[1].plot(dates, resolved_cum, 'r-', linewidth=2, label='Закрыто (накоп.)', 
-                               marker='s', markersize=4)
+            # Форматируются только показываемые даты, одним вызовом strftime
+            date_labels = pd.DatetimeIndex(dates[::step]).strftime('%Y-%m-%d')
+            axes[0].set_xticklabels(date_labels, rotation=45, ha='right')
+        
+        # График 3b: Накопительный итог (cumsum - только если готового итога нет)
+        if 'created_cumulative' in daily_data:
+            created_cum = np.asarray(daily_data['created_cumulative'])
         else:
-            # Если ключа нет, пытаемся вычислить из resolved
-            if len(resolved) == len(dates):
-                resolved_cum = np.cumsum(resolved)
-                axes[1].plot(dates, resolved_cum, 'r-', linewidth=2, label='Закрыто (накоп.)', 
-                           marker='s', markersize=4)
+            created_cum = np.cumsum(created)
+        
+        # Для resolved_cumulative проверяем наличие данных и совпадение длины,
+        # иначе вычисляем кумулятивную сумму из resolved
+        resolved_cum = None
+        if 'resolved_cumulative' in daily_data and len(daily_data['resolved_cumulative']) == len(dates):
+            resolved_cum = np.asarray(daily_data['resolved_cumulative'])
+        elif has_resolved:
+            resolved_cum = np.cumsum(resolved)
+        
+        if resolved_cum is not None:
+            axes[1].plot(dates, resolved_cum, 'r-', linewidth=2, label='Закрыто (накоп.)', 
+                       marker='s', markersize=4)
         
         # Всегда строим график созданных задач (накопительный)
         axes[1].plot(dates, created_cum, 'b-', linewidth=2, label='Создано (накоп.)', 
@@ -346,21 +1171,12 @@ class PlotBuilder:
         axes[1].grid(True, alpha=0.3)
         
         # Добавляем заполнение между кривыми, если есть обе
-        if 'resolved_cum' in locals() and len(created_cum) == len(resolved_cum):
+        if resolved_cum is not None and len(created_cum) == len(resolved_cum):
             axes[1].fill_between(dates, created_cum, resolved_cum, 
                                 where=created_cum >= resolved_cum, 
                                 alpha=0.2, color='blue', label='Нерешенные')
     
-        fig.suptitle('ГРАФИК 3: Динамика задач по дням', fontsize=16, fontweight='bold', y=1.02)
-        plt.tight_layout()
-    
-        filename = f"3_daily_tasks.{self.save_format}"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-    
-        self.logger.info(f"График 3 создан: {filepath}")
-        return filepath
+        fig.suptitle('ГРАФИК 3: Динамика задач по дням', fontsize=16, fontweight='bold', y=0.98)
     
     # ========== ГРАФИК 4: Топ-30 пользователей ==========
     
@@ -375,47 +1191,37 @@ class PlotBuilder:
         Returns:
             str: Путь к сохранённому файлу
         """
-        fig, ax = plt.subplots(figsize=(self.figure_size['width'], self.figure_size['height']))
+        fig = self._new_figure(self.figure_size['width'], self.figure_size['height'])
+        self._draw_top_users(fig, df_all)
+        filepath = self._save_figure(fig, "4_top_users")
         
-        # Собираем данные обо всех пользователях
-        user_tasks = {}
+        self.logger.info(f"График 4 создан: {filepath}")
+        return filepath
+    
+    def _draw_top_users(self, fig, df_all: pd.DataFrame):
+        """Рисует график 4 на фигуре (Figure или SubFigure дашборда)."""
+        ax = fig.subplots(gridspec_kw=_margins(left=0.2, top=0.9))
         
-        # Обрабатываем репортеров
-        if 'reporter' in df_all.columns:
-            reporter_data = df_all['reporter'].dropna()
-            for reporter in reporter_data:
-                if reporter in user_tasks:
-                    user_tasks[reporter]['reporter'] += 1
-                else:
-                    user_tasks[reporter] = {'reporter': 1, 'assignee': 0}
-        
-        # Обрабатываем исполнителей
-        if 'assignee' in df_all.columns:
-            assignee_data = df_all['assignee'].dropna()
-            for assignee in assignee_data:
-                if assignee in user_tasks:
-                    user_tasks[assignee]['assignee'] += 1
-                else:
-                    user_tasks[assignee] = {'reporter': 0, 'assignee': 1}
-        
-        if user_tasks:
-            # Рассчитываем общее количество задач для каждого пользователя
-            user_totals = {}
-            for user, counts in user_tasks.items():
-                total = counts['reporter'] + counts['assignee']
-                user_totals[user] = total
-            
-            # Сортируем по убыванию и берем топ-30
-            sorted_users = sorted(user_totals.items(), key=lambda x: x[1], reverse=True)
-            top_users = sorted_users[:30]
+        # Количество задач каждого пользователя как репортера и как исполнителя
+        # (подсчёт value_counts вместо обхода строк в Python)
+        empty_counts = pd.Series(dtype=np.int64)
+        rep = df_all['reporter'].dropna().value_counts() if 'reporter' in df_all.columns else empty_counts
+        asg = df_all['assignee'].dropna().value_counts() if 'assignee' in df_all.columns else empty_counts
+        
+        # Общее количество задач для каждого пользователя
+        user_totals = rep.add(asg, fill_value=0).astype(np.int64)
+        
+        if len(user_totals) > 0:
+            # Топ-30 по убыванию
+            top_users = user_totals.nlargest(30)
             
-            if top_users:
-                users = [user for user, _ in top_users]
-                totals = [total for _, total in top_users]
+            if len(top_users) > 0:
+                users = top_users.index.to_list()
+                totals = top_users.to_numpy()
                 
                 # Разделяем на репортерские и исполнительские задачи
-                reporter_counts = [user_tasks[user]['reporter'] for user in users]
-                assignee_counts = [user_tasks[user]['assignee'] for user in users]
+                reporter_counts = rep.reindex(users, fill_value=0).to_numpy()
+                assignee_counts = asg.reindex(users, fill_value=0).to_numpy()
                 
                 y_pos = np.arange(len(users))
                 bar_height = 0.35
@@ -431,33 +1237,29 @@ class PlotBuilder:
                 ax.set_yticklabels(users, fontsize=9)
                 ax.set_xlabel('Общее количество задач', fontsize=12)
                 ax.set_title(f'ГРАФИК 4: Топ-30 пользователей по задачам\n'
-                           f'(всего пользователей: {len(user_tasks)})', 
+                           f'(всего пользователей: {len(user_totals)})', 
                            fontsize=14, fontweight='bold')
                 ax.grid(True, alpha=0.3, axis='x')
                 
                 # Добавляем легенду
-                ax.legend(loc='center right')
+                ax.legend(loc=7)  # 7 = 'center right'
                 
-                # Добавляем общее количество задач на каждый столбец
-                for i, (total, reporter, assignee) in enumerate(zip(totals, reporter_counts, assignee_counts)):
-                    # Общее количество справа
-                    ax.text(total + max(totals)*0.01, i, f'всего: {total}', 
-                           va='center', fontsize=8, fontweight='bold')
-                    
-                    # Детализация внутри столбца (если есть место)
-                    if reporter > 0:
-                        ax.text(reporter/2, i, f'реп: {reporter}', 
-                               va='center', ha='center', fontsize=7, color='black')
-                    if assignee > 0:
-                        ax.text(reporter + assignee/2, i, f'исп: {assignee}', 
-                               va='center', ha='center', fontsize=7, color='black')
+                # Общее количество справа (у конца верхнего сегмента столбца)
+                ax.bar_label(bars_assignee, labels=[f'всего: {total}' for total in totals],
+                             padding=3, fontsize=8, fontweight='bold')
+                
+                # Детализация внутри столбца (пустая подпись для нулевых сегментов)
+                ax.bar_label(bars_reporter, labels=[f'реп: {r}' if r > 0 else '' for r in reporter_counts],
+                             label_type='center', fontsize=7, color='black')
+                ax.bar_label(bars_assignee, labels=[f'исп: {a}' if a > 0 else '' for a in assignee_counts],
+                             label_type='center', fontsize=7, color='black')
                 
                 # Статистика в углу
                 stats_text = (
-                    f'Всего задач: {sum(totals)}\n'
+                    f'Всего задач: {totals.sum()}\n'
                     f'Среднее на пользователя: {np.mean(totals):.1f}\n'
-                    f'Максимум: {max(totals)}\n'
-                    f'Минимум в топе: {min(totals)}'
+                    f'Максимум: {totals.max()}\n'
+                    f'Минимум в топе: {totals.min()}'
                 )
                 ax.text(0.75, 0.98, stats_text,
                        transform=ax.transAxes,
@@ -472,19 +1274,11 @@ class PlotBuilder:
             ax.text(0.5, 0.5, 'Нет данных о пользователях', 
                    ha='center', va='center')
             ax.set_title('Топ пользователей по задачам', fontsize=14)
-        
-        plt.tight_layout()
-        filename = f"4_top_users.{self.save_format}"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        self.logger.info(f"График 4 создан: {filepath}")
-        return filepath
     
     # ========== ГРАФИК 5: Залогированное время ==========
     
-    def plot_logged_time_histogram(self, df_closed: pd.DataFrame) -> str:
+    def plot_logged_time_histogram(self, df_closed: pd.DataFrame,
+                                   open_time_hours: Optional[np.ndarray] = None) -> str:
         """
         ГРАФИК 5: Гистограмма залогированного времени.
         Задание: "время, которое затратил пользователь на выполнение", "только закрытые задачи"
@@ -494,29 +1288,36 @@ class PlotBuilder:
         
         Args:
             df_closed: DataFrame с закрытыми задачами
+            open_time_hours: Столбец open_time_hours массивом float32 (вычисляется, если не передан)
             
         Returns:
             str: Путь к сохранённому файлу
         """
-        fig, ax = plt.subplots(figsize=(self.figure_size['width'], self.figure_size['height']))
+        fig = self._new_figure(self.figure_size['width'], self.figure_size['height'])
+        self._draw_logged_time_histogram(fig, df_closed, open_time_hours)
+        filepath = self._save_figure(fig, "5_logged_time_histogram")
+        
+        self.logger.info(f"График 5 создан: {filepath}")
+        return filepath
+    
+    def _draw_logged_time_histogram(self, fig, df_closed: pd.DataFrame, open_time_hours: Optional[np.ndarray]):
+        """Рисует график 5 на фигуре (Figure или SubFigure дашборда)."""
+        ax = fig.subplots(gridspec_kw=_margins(top=0.9))
         
-        if 'open_time_hours' in df_closed.columns:
-            data = df_closed['open_time_hours'].dropna()
+        if open_time_hours is None and 'open_time_hours' in df_closed.columns:
+            open_time_hours = _hours_array(df_closed['open_time_hours'])
+        
+        if open_time_hours is not None:
+            # Убирает пустые значения и выбросы
+            data, data_filtered = _prep_hist(open_time_hours)
             
             if len(data) > 0:
-                # Фильтруем выбросы
-                q95 = data.quantile(0.95)
-                data_filtered = data[data <= q95]
-                
-                if len(data_filtered) < 10:
-                    data_filtered = data
-                
                 # Строим гистограмму
                 n_bins = min(25, len(data_filtered))
-                ax.hist(
+                _draw_hist(
+                    ax,
                     data_filtered,
-                    bins=n_bins,
-                    edgecolor='black',
+                    n_bins,
                     alpha=0.7,
                     color='orange',
                     label=f'Приближённое время\n(всего: {len(data)} задач)'
@@ -529,7 +1330,7 @@ class PlotBuilder:
                 stats_text = (
                     f'Всего задач: {len(data)}\n'
                     f'Среднее: {data.mean():.1f} ч\n'
-                    f'Медиана: {data.median():.1f} ч\n'
+                    f'Медиана: {np.median(data):.1f} ч\n'
                     f'Максимум: {data.max():.1f} ч'
                 )
                 ax.text(
@@ -540,7 +1341,7 @@ class PlotBuilder:
                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8)
                 )
                 
-                ax.legend(loc='upper right')
+                ax.legend(loc=1)  # 1 = 'upper right'
                 ax.grid(True, alpha=0.3)
             else:
                 ax.text(0.5, 0.5, 'Нет данных о времени выполнения', 
@@ -551,15 +1352,6 @@ class PlotBuilder:
         
         ax.set_title('ГРАФИК 5: Распределение времени выполнения\n(закрытые задачи, приближённые данные)', 
                     fontsize=14, fontweight='bold')
-        
-        plt.tight_layout()
-        filename = f"5_logged_time_histogram.{self.save_format}"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        self.logger.info(f"График 5 создан: {filepath}")
-        return filepath
     
     # ========== ГРАФИК 6: Распределение по приоритетам ==========
     
@@ -574,22 +1366,32 @@ class PlotBuilder:
         Returns:
             str: Путь к сохранённому файлу
         """
-        fig, ax = plt.subplots(figsize=(self.figure_size['width'], self.figure_size['height']))
+        fig = self._new_figure(self.figure_size['width'], self.figure_size['height'])
+        self._draw_priority_distribution(fig, df_all)
+        filepath = self._save_figure(fig, "6_priority_distribution")
+        
+        self.logger.info(f"График 6 создан: {filepath}")
+        return filepath
+    
+    def _draw_priority_distribution(self, fig, df_all: pd.DataFrame):
+        """Рисует график 6 на фигуре (Figure или SubFigure дашборда)."""
+        ax = fig.subplots(gridspec_kw=_margins(bottom=0.2))
         
         if 'priority' in df_all.columns:
             priority_data = df_all['priority'].dropna()
             
             if len(priority_data) > 0:
+                # value_counts уже сортирует по убыванию
                 priority_counts = priority_data.value_counts()
-                
-                # Сортируем по убыванию
-                priority_counts = priority_counts.sort_values(ascending=False)
+                vals = priority_counts.to_numpy()  # Количество задач
+                labels = priority_counts.index.to_numpy()  # Названия приоритетов
+                positions = np.arange(len(vals))  # Позиции столбцов
                 
                 # Создаём столбчатую диаграмму
                 bars = ax.bar(
-                    range(len(priority_counts)),
-                    priority_counts.values,
-                    color=plt.cm.Set2(np.linspace(0, 1, len(priority_counts))),
+                    positions,
+                    vals,
+                    color=plt.cm.Set2(np.linspace(0, 1, len(vals))),
                     edgecolor='black',
                     alpha=0.8
                 )
@@ -597,21 +1399,12 @@ class PlotBuilder:
                 # Настройка осей
                 ax.set_xlabel('Степень серьезности (приоритет)', fontsize=12)
                 ax.set_ylabel('Количество задач', fontsize=12)
-                ax.set_xticks(range(len(priority_counts)))
-                ax.set_xticklabels(priority_counts.index, rotation=45, ha='right')
+                ax.set_xticks(positions)
+                ax.set_xticklabels(labels, rotation=45, ha='right')
                 
                 # Добавляем значения на столбцы
-                for bar, value in zip(bars, priority_counts.values):
-                    height = bar.get_height()
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2,
-                        height + 0.5,
-                        str(value),
-                        ha='center',
-                        va='bottom',
-                        fontsize=10,
-                        fontweight='bold'
-                    )
+                ax.bar_label(bars, labels=[str(value) for value in vals],
+                             padding=3, fontsize=10, fontweight='bold')
                 
                 # Статистика
                 total_tasks = len(df_all)
@@ -637,15 +1430,21 @@ class PlotBuilder:
         
         ax.set_title('ГРАФИК 6: Распределение задач по степени серьезности (все задачи)', 
                     fontsize=14, fontweight='bold')
+
+
+def _plot_in_worker(settings: Dict[str, Any], method_name: str, args: tuple) -> str:
+    """
+    Строит один график в процессе пула.
+    
+    Args:
+        settings: Настройки визуализации (PlotBuilder._worker_settings)
+        method_name: Имя метода графика (например "plot_top_users")
+        args: Аргументы метода
         
-        plt.tight_layout()
-        filename = f"6_priority_distribution.{self.save_format}"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=self.dpi, bbox_inches='tight')
-        plt.close()
-        
-        self.logger.info(f"График 6 создан: {filepath}")
-        return filepath
+    Returns:
+        str: Путь к сохранённому файлу
+    """
+    return getattr(PlotBuilder(settings), method_name)(*args)
 
 
 # ========== ФУНКЦИЯ ДЛЯ ТЕСТИРОВАНИЯ ==========
@@ -668,19 +1467,27 @@ def test_plot_builder():
         }
     }
     
+    # Тестовые DataFrame собираются из массивов NumPy (np.tile), а не из списков Python:
+    # при увеличении n_repeat для замеров на больших объёмах нет поэлементных объектов
+    n_repeat = 4  # Повторений шаблона из 5 задач
+    open_time_hours = np.tile(np.array([24, 48, 72, 96, 120], dtype=np.int16), n_repeat)
+    statuses = ['Closed', 'Open', 'In Progress', 'Resolved']
+    
     # Тестовый DataFrame для всех задач
     test_df_all = pd.DataFrame({
-        'reporter': ['User A', 'User B', 'User A', 'User C', 'User B'] * 4,
-        'assignee': ['Dev A', 'Dev B', 'Dev A', 'Dev C', 'Dev B'] * 4,
-        'priority': ['Critical', 'Major', 'Minor', 'Trivial', 'Major'] * 4,
-        'status': ['Closed', 'Open', 'In Progress', 'Resolved', 'Closed'] * 4,
-        'open_time_hours': [24, 48, 72, 96, 120] * 4
+        'reporter': np.tile(np.array(['User A', 'User B', 'User A', 'User C', 'User B'], dtype=object), n_repeat),
+        'assignee': np.tile(np.array(['Dev A', 'Dev B', 'Dev A', 'Dev C', 'Dev B'], dtype=object), n_repeat),
+        'priority': pd.Categorical.from_codes(np.tile(np.array([0, 1, 2, 3, 1], dtype=np.int8), n_repeat),
+                                              categories=['Critical', 'Major', 'Minor', 'Trivial']),
+        'status': pd.Categorical.from_codes(np.tile(np.array([0, 1, 2, 3, 0], dtype=np.int8), n_repeat),
+                                            categories=statuses),
+        'open_time_hours': open_time_hours
     })
     
     # Тестовый DataFrame для закрытых задач
     test_df_closed = pd.DataFrame({
-        'status': ['Closed', 'Closed', 'Closed', 'Closed', 'Closed'] * 4,
-        'open_time_hours': [24, 48, 72, 96, 120] * 4
+        'status': pd.Categorical.from_codes(np.zeros(5 * n_repeat, dtype=np.int8), categories=statuses),
+        'open_time_hours': open_time_hours
     })
     
     # Тестовая конфигурация